@@ -21,6 +21,7 @@ Debug output is saved to ~/.finamt/debug/<receipt_id>/.
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import time
 from finamt import progress as _progress
@@ -211,7 +212,12 @@ class FinanceAgent:
             ext  = src.suffix.lower() or ".pdf"
             dest = pdf_dir / f"{receipt_id}{ext}"
             if not dest.exists():
-                shutil.copy2(src, dest)
+                if src.parent == pdf_dir:
+                    # Upload was streamed straight into pdfs/ — storing it
+                    # is an atomic rename, not a second full-file write.
+                    os.replace(src, dest)
+                else:
+                    shutil.copy2(src, dest)
                 logger.info("File stored: %s", dest)
         except Exception as exc:  # noqa: BLE001
             logger.warning("Could not store file copy: %s", exc)
\ No newline at end of file
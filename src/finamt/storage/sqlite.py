@@ -22,12 +22,14 @@ from __future__ import annotations
 
 import json
 import sqlite3
-import json
 import threading
+from contextlib import contextmanager
 from datetime import date, datetime, timezone
 from decimal import Decimal
+from os import urandom
 from pathlib import Path
 from typing import Iterable
+from uuid import UUID, uuid4
 
 from .base import ReceiptRepository
 from .project import resolve_project
@@ -39,6 +41,23 @@ from ..models import (
 DEFAULT_DB_PATH = resolve_project().db_path   # ~/.finamt/default/finamt.db
 _SCHEMA_VERSION = 1
 
+# Multi-row item insert prefix — save() appends one (?,...) group per row.
+_ITEM_INSERT_HEAD = """INSERT INTO receipt_items
+       (id, receipt_id, position, description, quantity, unit_price,
+        total_price, vat_rate, vat_amount, category)
+       VALUES """
+
+
+def _bulk_uuids(n: int) -> list[str]:
+    """Generate *n* random (version-4) UUID strings from a single urandom read.
+
+    ``uuid.uuid4()`` performs one 16-byte urandom syscall per call; for a
+    receipt with many line items that adds up, so child-row IDs are sliced
+    from one bulk read instead.
+    """
+    raw = urandom(16 * n)
+    return [str(UUID(bytes=raw[i * 16:(i + 1) * 16], version=4)) for i in range(n)]
+
 
 class SQLiteRepository:
     """Persistent SQLite storage implementing ``ReceiptRepository``."""
@@ -46,16 +65,50 @@ class SQLiteRepository:
     def __init__(self, db_path: Path | str | None = None) -> None:
         self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
         self._conn = sqlite3.connect(
             self.db_path, check_same_thread=False,
             detect_types=sqlite3.PARSE_DECLTYPES,
         )
         self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._configure(self._conn)
         self._conn.execute("PRAGMA foreign_keys=ON")
         self._init_schema()
         self._cleanup_orphaned_counterparties()
+        # Second, read-only connection for all SELECT paths.  WAL gives
+        # reader/writer concurrency between connections, so reads never
+        # queue behind an in-flight write on ``_conn`` (and need no lock).
+        self._read_conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        self._read_conn.row_factory = sqlite3.Row
+        self._configure(self._read_conn)
+        # Third, bare connection for scalar probes (exists/count).  No
+        # detect_types and no row_factory: PARSE_DECLTYPES parses every
+        # column description for converter dispatch on each fetch, pure
+        # overhead for a SELECT 1 that runs before every save().
+        self._fast_conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True,
+            check_same_thread=False,
+        )
+        self._configure(self._fast_conn)
+
+    @staticmethod
+    def _configure(conn: sqlite3.Connection) -> None:
+        """Apply per-connection pragmas (run once, at open).
+
+        WAL + synchronous=NORMAL is the standard pairing: commits stop
+        fsyncing on every transaction while WAL still guarantees
+        durability up to a power loss.  The remaining pragmas trade a
+        little memory for fewer temp files and page-cache misses.
+        """
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-8192")
+        conn.execute("PRAGMA mmap_size=134217728")
 
     # ------------------------------------------------------------------
     # Context manager
@@ -68,15 +121,16 @@ class SQLiteRepository:
         self.close()
 
     def close(self) -> None:
-        with self._lock:
-            self._conn.close()
+        self._fast_conn.close()
+        self._read_conn.close()
+        self._conn.close()
 
     # ------------------------------------------------------------------
     # Schema
     # ------------------------------------------------------------------
 
     def _init_schema(self) -> None:
-        with self._lock:
+        with self._write_lock:
             version = self._conn.execute("PRAGMA user_version").fetchone()[0]
             if version == 0:
                 self._create_tables()
@@ -87,6 +141,10 @@ class SQLiteRepository:
 
     def _migrate(self) -> None:
         """Idempotent column/table additions for schema evolution."""
+        # Introspect existing columns instead of firing ALTER TABLE into a
+        # bare except: a failing DDL statement bumps the schema version and
+        # invalidates prepared statements on every open of a current DB.
+        existing: dict[str, set[str]] = {}
         for tbl, col, typedef in [
             ("receipt_items",      "position",            "INTEGER"),
             ("receipt_items",      "vat_amount",           "TEXT"),
@@ -102,12 +160,37 @@ class SQLiteRepository:
             ("receipts",           "validation_warnings",  "TEXT"),
             ("receipts",           "einfuhr_vat",          "TEXT"),
         ]:
-            try:
-                self._conn.execute(f"ALTER TABLE {tbl} ADD COLUMN {col} {typedef}")
-                self._conn.commit()
-            except Exception:
-                pass  # column already exists — expected on all but first run
-        
+            if tbl not in existing:
+                existing[tbl] = {
+                    r[1] for r in self._conn.execute(f"PRAGMA table_info({tbl})")
+                }
+            # Empty table_info means the table itself doesn't exist yet on
+            # this (old) DB — the CREATE IF NOT EXISTS further down creates
+            # it with the column already in place, so there's nothing to ALTER.
+            if not existing[tbl]:
+                continue
+            if col not in existing[tbl]:
+                try:
+                    self._conn.execute(f"ALTER TABLE {tbl} ADD COLUMN {col} {typedef}")
+                except sqlite3.OperationalError:
+                    # Duplicate column: another pooled repository migrated the
+                    # same DB between our introspection and this ALTER.
+                    pass
+                existing[tbl].add(col)
+        self._conn.commit()
+
+        # content_hash duplicated receipt_id byte for byte (the id IS the
+        # content hash), so drop it where SQLite supports DROP COLUMN.
+        content_cols = {
+            r[1] for r in self._conn.execute("PRAGMA table_info(receipt_content)")
+        }
+        if "content_hash" in content_cols and sqlite3.sqlite_version_info >= (3, 35, 0):
+            self._conn.execute("ALTER TABLE receipt_content DROP COLUMN content_hash")
+            self._conn.commit()
+            content_cols.discard("content_hash")
+        # Older SQLite can't drop the NOT NULL column — keep writing it there.
+        self._content_has_hash = "content_hash" in content_cols
+
         # Migrate existing street/street_number data to street_and_number
         try:
             self._conn.execute("""
@@ -119,6 +202,27 @@ class SQLiteRepository:
         except Exception:
             pass  # migration already done or not needed
         
+        # Composite indexes so find_by_category / find_by_type satisfy the
+        # equality filter *and* the date sort from index order alone (no
+        # temp B-tree).  The single-column indexes they replace are dropped.
+        self._conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_receipts_cat_date
+                ON receipts (category, receipt_date DESC);
+            CREATE INDEX IF NOT EXISTS idx_receipts_type_date
+                ON receipts (receipt_type, receipt_date DESC);
+            CREATE INDEX IF NOT EXISTS idx_receipts_type_cat_date
+                ON receipts (receipt_type, category, receipt_date DESC);
+            DROP INDEX IF EXISTS idx_receipts_category;
+            DROP INDEX IF EXISTS idx_receipts_type;
+            -- Partial index: only verified counterparties are hot (the picker
+            -- dropdown), and most rows have verified=0, so index just those.
+            CREATE INDEX IF NOT EXISTS idx_cp_verified_name
+                ON counterparties (name COLLATE NOCASE) WHERE verified = 1;
+            CREATE INDEX IF NOT EXISTS idx_ustva
+                ON receipts (receipt_date, vat_amount);
+        """)
+        self._conn.commit()
+
         # vat_splits table (safe CREATE IF NOT EXISTS)
         self._conn.executescript("""
             CREATE TABLE IF NOT EXISTS receipt_vat_splits (
@@ -182,6 +286,8 @@ class SQLiteRepository:
 
             CREATE INDEX IF NOT EXISTS idx_cp_name   ON counterparties (name COLLATE NOCASE);
             CREATE INDEX IF NOT EXISTS idx_cp_vat_id ON counterparties (vat_id);
+            CREATE INDEX IF NOT EXISTS idx_cp_verified_name
+                ON counterparties (name COLLATE NOCASE) WHERE verified = 1;
 
             CREATE TABLE IF NOT EXISTS receipts (
                 id               TEXT PRIMARY KEY,  -- SHA-256 content hash
@@ -197,9 +303,12 @@ class SQLiteRepository:
                 created_at       TEXT NOT NULL
             );
 
-            CREATE INDEX IF NOT EXISTS idx_receipts_date     ON receipts (receipt_date);
-            CREATE INDEX IF NOT EXISTS idx_receipts_category ON receipts (category);
-            CREATE INDEX IF NOT EXISTS idx_receipts_type     ON receipts (receipt_type);
+            CREATE INDEX IF NOT EXISTS idx_receipts_date      ON receipts (receipt_date);
+            CREATE INDEX IF NOT EXISTS idx_ustva              ON receipts (receipt_date, vat_amount);
+            CREATE INDEX IF NOT EXISTS idx_receipts_cat_date  ON receipts (category, receipt_date DESC);
+            CREATE INDEX IF NOT EXISTS idx_receipts_type_date ON receipts (receipt_type, receipt_date DESC);
+            CREATE INDEX IF NOT EXISTS idx_receipts_type_cat_date
+                ON receipts (receipt_type, category, receipt_date DESC);
 
             CREATE TABLE IF NOT EXISTS receipt_items (
                 id           TEXT PRIMARY KEY,
@@ -229,8 +338,7 @@ class SQLiteRepository:
 
             CREATE TABLE IF NOT EXISTS receipt_content (
                 receipt_id   TEXT PRIMARY KEY REFERENCES receipts(id) ON DELETE CASCADE,
-                raw_text     TEXT,
-                content_hash TEXT NOT NULL
+                raw_text     TEXT
             );
 
             CREATE TABLE IF NOT EXISTS postings (
@@ -254,24 +362,50 @@ class SQLiteRepository:
     # ------------------------------------------------------------------
 
     def _exec(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
-        with self._lock:
+        with self._write_lock:
             cur = self._conn.execute(sql, params)
             self._conn.commit()
             return cur
 
     def _execmany(self, sql: str, rows: list) -> None:
-        with self._lock:
+        with self._write_lock:
             self._conn.executemany(sql, rows)
             self._conn.commit()
 
+    @contextmanager
+    def _txn(self):
+        """Run a block of statements as one write transaction.
+
+        Acquires the write lock, issues ``BEGIN IMMEDIATE`` and commits on
+        normal exit (rollback on error) — one fsync for the whole block
+        instead of one per ``_exec`` call.
+        """
+        with self._write_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.rollback()
+                raise
+            else:
+                self._conn.commit()
+
+    def _replace_children(self, receipt_id: str, table: str, insert_sql: str,
+                          rows: list[tuple]) -> None:
+        """Swap all child rows of *receipt_id* in *table*: DELETE + batched INSERT.
+
+        Must be called inside an open ``_txn`` block — it issues no commit of
+        its own, so the replace rides on the caller's single transaction.
+        """
+        self._conn.execute(
+            f"DELETE FROM {table} WHERE receipt_id = ?", (receipt_id,)
+        )
+        self._conn.executemany(insert_sql, rows)
+
     @staticmethod
     def _now() -> str:
         return datetime.now(timezone.utc).isoformat()
 
-    @staticmethod
-    def _dec(v) -> Decimal | None:
-        return Decimal(str(v)) if v is not None else None
-
     # ------------------------------------------------------------------
     # Counterparty deduplication
     # ------------------------------------------------------------------
@@ -290,7 +424,7 @@ class SQLiteRepository:
         The SELECT + INSERT is performed under the write lock to prevent
         duplicate rows from concurrent uploads.
         """
-        with self._lock:
+        with self._write_lock:
             row = None
             if cp.name and cp.name.strip():
                 row = self._conn.execute(
@@ -326,7 +460,7 @@ class SQLiteRepository:
         be removed.  This is the only automatic counterparty housekeeping;
         everything else is driven by explicit user actions in the UI.
         """
-        with self._lock:
+        with self._write_lock:
             self._conn.execute(
                 """
                 DELETE FROM counterparties
@@ -344,7 +478,7 @@ class SQLiteRepository:
             name=row["name"],
             address=Address(
                 street_and_number=row["street_and_number"],
-                address_supplement=row["address_supplement"] if "address_supplement" in row.keys() else None,
+                address_supplement=row["address_supplement"],
                 postcode=row["postcode"],
                 city=row["city"],
                 state=row["state"],
@@ -365,10 +499,13 @@ class SQLiteRepository:
         Returns ``True`` on success, ``False`` if a duplicate already exists.
         Raises no exceptions on duplicate — callers check the return value
         or call ``exists()`` first.
-        """
-        if self.exists(receipt.id):
-            return False
 
+        Duplicates are detected by the PRIMARY KEY itself (ON CONFLICT DO
+        NOTHING + rowcount) instead of a separate exists() probe — one
+        statement less per save and no check-then-insert race.  A
+        counterparty row created for a duplicate becomes an orphan and is
+        removed by _cleanup_orphaned_counterparties on the next open.
+        """
         # Resolve/create counterparty
         cp_id: str | None = None
         if receipt.counterparty:
@@ -381,80 +518,107 @@ class SQLiteRepository:
             d = receipt.receipt_date.date() if isinstance(receipt.receipt_date, datetime) else receipt.receipt_date
             date_str = d.isoformat()
 
-        with self._lock:
-            # receipts
-            self._conn.execute(
-                """INSERT INTO receipts
-                   (id, counterparty_id, receipt_type, receipt_number,
-                    receipt_date, total_amount, vat_percentage, vat_amount,
-                    currency, category, subcategory, description,
-                    private_use_share, validation_warnings, einfuhr_vat, created_at)
-                   VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                (
-                    receipt.id, cp_id, str(receipt.receipt_type),
-                    receipt.receipt_number, date_str,
-                    str(receipt.total_amount)   if receipt.total_amount   is not None else None,
-                    str(receipt.vat_percentage) if receipt.vat_percentage is not None else None,
-                    str(receipt.vat_amount)     if receipt.vat_amount     is not None else None,
-                    getattr(receipt, "currency", "EUR") or "EUR",
-                    str(receipt.category),
-                    getattr(receipt, "subcategory", None),
-                    getattr(receipt, "description", None) or None,
-                    str(getattr(receipt, "private_use_share", "0") or "0"),
-                    json.dumps(getattr(receipt, "validation_warnings", []) or []),
-                    str(getattr(receipt, "einfuhr_vat", None) or "") or None,
-                    self._now(),
-                ),
-            )
+        # One timestamp for every row of this receipt — that is what
+        # created_at means, and it saves repeated now()/isoformat() calls.
+        now = self._now()
 
-            # receipt_items
-            import uuid as _uuid
-            item_rows = [
-                (
-                    str(_uuid.uuid4()), receipt.id,
-                    item.position,
-                    item.description,
-                    str(item.quantity)    if item.quantity    is not None else None,
-                    str(item.unit_price)  if item.unit_price  is not None else None,
-                    str(item.total_price) if item.total_price is not None else None,
-                    str(item.vat_rate)    if item.vat_rate    is not None else None,
-                    str(item.vat_amount)  if item.vat_amount  is not None else None,
-                    str(item.category),
+        with self._write_lock:
+            # Any failure mid-write leaves the implicit transaction open;
+            # roll back so the connection (and the SQLite write lock a
+            # pooled repo would otherwise keep holding) comes out clean.
+            try:
+                # receipts
+                cur = self._conn.execute(
+                    """INSERT INTO receipts
+                       (id, counterparty_id, receipt_type, receipt_number,
+                        receipt_date, total_amount, vat_percentage, vat_amount,
+                        currency, category, subcategory, description,
+                        private_use_share, validation_warnings, einfuhr_vat, created_at)
+                       VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+                       ON CONFLICT(id) DO NOTHING""",
+                    (
+                        receipt.id, cp_id, str(receipt.receipt_type),
+                        receipt.receipt_number, date_str,
+                        str(receipt.total_amount)   if receipt.total_amount   is not None else None,
+                        str(receipt.vat_percentage) if receipt.vat_percentage is not None else None,
+                        str(receipt.vat_amount)     if receipt.vat_amount     is not None else None,
+                        getattr(receipt, "currency", "EUR") or "EUR",
+                        str(receipt.category),
+                        getattr(receipt, "subcategory", None),
+                        getattr(receipt, "description", None) or None,
+                        str(getattr(receipt, "private_use_share", "0") or "0"),
+                        json.dumps(getattr(receipt, "validation_warnings", []) or []),
+                        str(getattr(receipt, "einfuhr_vat", None) or "") or None,
+                        now,
+                    ),
                 )
-                for item in receipt.items
-            ]
-            self._conn.executemany(
-                """INSERT INTO receipt_items
-                   (id, receipt_id, position, description, quantity, unit_price,
-                    total_price, vat_rate, vat_amount, category)
-                   VALUES (?,?,?,?,?,?,?,?,?,?)""",
-                item_rows,
-            )
-
-            # vat_splits
-            if hasattr(receipt, 'vat_splits') and receipt.vat_splits:
-                import uuid as _uuid_vs
-                for pos, split in enumerate(receipt.vat_splits, start=1):
+                if cur.rowcount == 0:     # duplicate receipt
+                    self._conn.rollback()
+                    return False
+
+                # receipt_items — multi-row VALUES so the VDBE prologue runs once
+                # per chunk instead of once per row.  90 rows × 10 columns =
+                # 900 variables, under the 999 SQLITE_MAX_VARIABLE_NUMBER
+                # default of SQLite < 3.32 (e.g. RHEL 8 ships 3.26).
+                item_ids = _bulk_uuids(len(receipt.items))
+                item_rows = [
+                    (
+                        item_id, receipt.id,
+                        item.position,
+                        item.description,
+                        str(item.quantity)    if item.quantity    is not None else None,
+                        str(item.unit_price)  if item.unit_price  is not None else None,
+                        str(item.total_price) if item.total_price is not None else None,
+                        str(item.vat_rate)    if item.vat_rate    is not None else None,
+                        str(item.vat_amount)  if item.vat_amount  is not None else None,
+                        str(item.category),
+                    )
+                    for item_id, item in zip(item_ids, receipt.items)
+                ]
+                if len(item_rows) > 1:
+                    for i in range(0, len(item_rows), 90):
+                        chunk = item_rows[i:i + 90]
+                        placeholders = ",".join(["(?,?,?,?,?,?,?,?,?,?)"] * len(chunk))
+                        flat = [v for row in chunk for v in row]
+                        self._conn.execute(_ITEM_INSERT_HEAD + placeholders, flat)
+                elif item_rows:
                     self._conn.execute(
-                        """INSERT INTO receipt_vat_splits (id, receipt_id, position, vat_rate, vat_amount, net_amount)
-                           VALUES (?, ?, ?, ?, ?, ?)""",
-                        (str(_uuid_vs.uuid4()), receipt.id, split.get("position", pos),
-                         str(split["vat_rate"]) if split.get("vat_rate") is not None else None,
-                         str(split["vat_amount"]) if split.get("vat_amount") is not None else None,
-                         str(split["net_amount"]) if split.get("net_amount") is not None else None),
+                        _ITEM_INSERT_HEAD + "(?,?,?,?,?,?,?,?,?,?)", item_rows[0]
                     )
 
-            # receipt_content
-            self._conn.execute(
-                """INSERT INTO receipt_content (receipt_id, raw_text, content_hash)
-                   VALUES (?,?,?)""",
-                (receipt.id, receipt.raw_text, receipt.id),
-            )
+                # vat_splits
+                if hasattr(receipt, 'vat_splits') and receipt.vat_splits:
+                    split_ids = _bulk_uuids(len(receipt.vat_splits))
+                    for pos, split in enumerate(receipt.vat_splits, start=1):
+                        self._conn.execute(
+                            """INSERT INTO receipt_vat_splits (id, receipt_id, position, vat_rate, vat_amount, net_amount)
+                               VALUES (?, ?, ?, ?, ?, ?)""",
+                            (split_ids[pos - 1], receipt.id, split.get("position", pos),
+                             str(split["vat_rate"]) if split.get("vat_rate") is not None else None,
+                             str(split["vat_amount"]) if split.get("vat_amount") is not None else None,
+                             str(split["net_amount"]) if split.get("net_amount") is not None else None),
+                        )
+
+                # receipt_content
+                if self._content_has_hash:
+                    self._conn.execute(
+                        """INSERT INTO receipt_content (receipt_id, raw_text, content_hash)
+                           VALUES (?,?,?)""",
+                        (receipt.id, receipt.raw_text, receipt.id),
+                    )
+                else:
+                    self._conn.execute(
+                        "INSERT INTO receipt_content (receipt_id, raw_text) VALUES (?,?)",
+                        (receipt.id, receipt.raw_text),
+                    )
 
-            # postings — generate and persist double-entry journal entries
-            self._insert_postings(receipt)
+                # postings — generate and persist double-entry journal entries
+                self._insert_postings(receipt, now=now)
 
-            self._conn.commit()
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
 
         return True
 
@@ -462,22 +626,23 @@ class SQLiteRepository:
     # Postings helpers
     # ------------------------------------------------------------------
 
-    def _insert_postings(self, receipt: ReceiptData) -> None:
+    def _insert_postings(self, receipt: ReceiptData, now: str | None = None) -> None:
         """Generate postings from *receipt* and write them to the DB.
 
         Called inside an existing write-lock context so it must **not** call
-        ``self._lock`` again.
+        ``self._write_lock`` again.
         """
-        import uuid as _uuid_p
         postings = receipt.generate_postings()
-        now = self._now()
+        posting_ids = _bulk_uuids(len(postings))
+        if now is None:
+            now = self._now()
         for pos, p in enumerate(postings, start=1):
             self._conn.execute(
                 """INSERT INTO postings
                    (id, receipt_id, position, posting_type, direction, amount, description, created_at)
                    VALUES (?,?,?,?,?,?,?,?)""",
                 (
-                    str(_uuid_p.uuid4()),
+                    posting_ids[pos - 1],
                     receipt.id,
                     pos,
                     str(p.posting_type),
@@ -497,7 +662,7 @@ class SQLiteRepository:
         receipt = self.get(receipt_id)
         if receipt is None:
             return
-        with self._lock:
+        with self._write_lock:
             self._conn.execute(
                 "DELETE FROM postings WHERE receipt_id = ?", (receipt_id,)
             )
@@ -506,7 +671,7 @@ class SQLiteRepository:
 
     def get_postings(self, receipt_id: str) -> list[Posting]:
         """Return all postings for *receipt_id*, ordered by position."""
-        rows = self._conn.execute(
+        rows = self._read_conn.execute(
             """SELECT * FROM postings
                WHERE receipt_id = ?
                ORDER BY position ASC""",
@@ -529,7 +694,7 @@ class SQLiteRepository:
 
     def list_all_postings(self) -> list[dict]:
         """Return all postings across all receipts as dicts (e.g. for EÜR derivation)."""
-        rows = self._conn.execute(
+        rows = self._read_conn.execute(
             """SELECT p.*, r.receipt_date, r.receipt_type, r.category
                FROM postings p
                JOIN receipts r ON r.id = p.receipt_id
@@ -555,16 +720,16 @@ class SQLiteRepository:
     # ------------------------------------------------------------------
 
     def exists(self, receipt_id: str) -> bool:
-        row = self._conn.execute(
+        row = self._fast_conn.execute(
             "SELECT 1 FROM receipts WHERE id = ?", (receipt_id,)
         ).fetchone()
         return row is not None
 
     def get(self, receipt_id: str) -> ReceiptData | None:
-        row = self._conn.execute(
+        row = self._read_conn.execute(
             """SELECT r.*, rc.raw_text,
                       c.id as cp_id, c.name as cp_name,
-                      c.street_and_number, c.postcode, c.city, c.state, c.country,
+                      c.street_and_number, c.address_supplement, c.postcode, c.city, c.state, c.country,
                       c.tax_number, c.vat_id, COALESCE(c.verified, 0) as verified
                FROM receipts r
                LEFT JOIN receipt_content rc ON rc.receipt_id = r.id
@@ -641,126 +806,123 @@ class SQLiteRepository:
             vw = receipt_updates["validation_warnings"]
             receipt_updates["validation_warnings"] = json.dumps(vw if isinstance(vw, list) else [])
 
-        # Apply receipt-level updates
-        if receipt_updates:
-            set_clause = ", ".join(f"{col} = ?" for col in receipt_updates)
-            params = tuple(receipt_updates.values()) + (receipt_id,)
-            self._exec(f"UPDATE receipts SET {set_clause} WHERE id = ?", params)
+        with self._txn():
+            # Apply receipt-level updates
+            if receipt_updates:
+                set_clause = ", ".join(f"{col} = ?" for col in receipt_updates)
+                params = tuple(receipt_updates.values()) + (receipt_id,)
+                self._conn.execute(f"UPDATE receipts SET {set_clause} WHERE id = ?", params)
 
-        # Counterparty updates
-        cp_row = self._conn.execute(
-            "SELECT counterparty_id FROM receipts WHERE id = ?", (receipt_id,)
-        ).fetchone()
-        cp_id = cp_row["counterparty_id"] if cp_row else None
-
-        # If the caller specifies an existing counterparty to link to, re-point the
-        # receipt to that CP and skip all field-level CP updates — the selected CP's
-        # data is already correct as-is in the DB.  The old CP becomes an orphan and
-        # will be removed by _cleanup_orphaned_counterparties on the next DB open.
-        skip_cp_field_updates = False
-        if fields.get("counterparty_id"):
-            new_cp_id = str(fields["counterparty_id"])
-            self._exec(
-                "UPDATE receipts SET counterparty_id = ? WHERE id = ?",
-                (new_cp_id, receipt_id),
-            )
-            cp_id = new_cp_id  # used by counterparty_verified logic below
-            skip_cp_field_updates = True
-
-        # Collect all counterparty field changes
-        # vat_id and tax_number may be explicitly cleared (set to null/empty),
-        # so include them whenever the key is present — even if the value is None.
-        # name is only updated when a non-empty value is supplied.
-        cp_updates: dict = {}
-        for field_in, col in CP_SCALAR.items():
-            if field_in not in fields:
-                continue
-            val = fields[field_in]
-            if col == "name" and not val:   # never clear the supplier name
-                continue
-            # Normalise empty string → None so SQLite stores NULL
-            cp_updates[col] = val if val else None
-        addr = fields.get("address", {})
-        if isinstance(addr, dict):
-            for k in ADDR_FIELDS:
-                if k in addr:
-                    cp_updates[k] = addr[k]
-
-        if cp_updates and not skip_cp_field_updates:
-            if cp_id:
-                # Edit the counterparty row directly.  All receipts sharing this
-                # counterparty will reflect the change — which is the desired
-                # behaviour (if OpenAI was mis-labelled everywhere, fix it once).
-                # Note: verified is NOT touched here — it must only be set by an
-                # explicit user action (checkbox / select-from-verified).  The
-                # orphan-cleanup routine uses receipt references, not this flag.
-                set_clause = ", ".join(f"{col} = ?" for col in cp_updates)
-                params = tuple(cp_updates.values()) + (cp_id,)
-                self._exec(
-                    f"UPDATE counterparties SET {set_clause} WHERE id = ?", params
-                )
-            else:
-                # No counterparty row yet — create one and link it to the receipt
-                import uuid
-                new_cp_id = str(uuid.uuid4())
-                self._exec(
-                    """INSERT INTO counterparties
-                       (id, name, street_and_number, address_supplement, postcode, city, state, country,
-                        tax_number, vat_id, created_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        new_cp_id,
-                        cp_updates.get("name"),
-                        cp_updates.get("street_and_number"),
-                        cp_updates.get("address_supplement"),
-                        cp_updates.get("postcode"),
-                        cp_updates.get("city"),
-                        cp_updates.get("state"),
-                        cp_updates.get("country"),
-                        cp_updates.get("tax_number"),
-                        cp_updates.get("vat_id"),
-                        self._now(),
-                    ),
-                )
-                self._exec(
+            # Counterparty updates
+            cp_row = self._conn.execute(
+                "SELECT counterparty_id FROM receipts WHERE id = ?", (receipt_id,)
+            ).fetchone()
+            cp_id = cp_row["counterparty_id"] if cp_row else None
+
+            # If the caller specifies an existing counterparty to link to, re-point the
+            # receipt to that CP and skip all field-level CP updates — the selected CP's
+            # data is already correct as-is in the DB.  The old CP becomes an orphan and
+            # will be removed by _cleanup_orphaned_counterparties on the next DB open.
+            skip_cp_field_updates = False
+            if fields.get("counterparty_id"):
+                new_cp_id = str(fields["counterparty_id"])
+                self._conn.execute(
                     "UPDATE receipts SET counterparty_id = ? WHERE id = ?",
                     (new_cp_id, receipt_id),
                 )
+                cp_id = new_cp_id  # used by counterparty_verified logic below
+                skip_cp_field_updates = True
+
+            # Collect all counterparty field changes
+            # vat_id and tax_number may be explicitly cleared (set to null/empty),
+            # so include them whenever the key is present — even if the value is None.
+            # name is only updated when a non-empty value is supplied.
+            cp_updates: dict = {}
+            for field_in, col in CP_SCALAR.items():
+                if field_in not in fields:
+                    continue
+                val = fields[field_in]
+                if col == "name" and not val:   # never clear the supplier name
+                    continue
+                # Normalise empty string → None so SQLite stores NULL
+                cp_updates[col] = val if val else None
+            addr = fields.get("address", {})
+            if isinstance(addr, dict):
+                for k in ADDR_FIELDS:
+                    if k in addr:
+                        cp_updates[k] = addr[k]
+
+            if cp_updates and not skip_cp_field_updates:
+                if cp_id:
+                    # Edit the counterparty row directly.  All receipts sharing this
+                    # counterparty will reflect the change — which is the desired
+                    # behaviour (if OpenAI was mis-labelled everywhere, fix it once).
+                    # Note: verified is NOT touched here — it must only be set by an
+                    # explicit user action (checkbox / select-from-verified).  The
+                    # orphan-cleanup routine uses receipt references, not this flag.
+                    set_clause = ", ".join(f"{col} = ?" for col in cp_updates)
+                    params = tuple(cp_updates.values()) + (cp_id,)
+                    self._conn.execute(
+                        f"UPDATE counterparties SET {set_clause} WHERE id = ?", params
+                    )
+                else:
+                    # No counterparty row yet — create one and link it to the receipt
+                    new_cp_id = str(uuid4())
+                    self._conn.execute(
+                        """INSERT INTO counterparties
+                           (id, name, street_and_number, address_supplement, postcode, city, state, country,
+                            tax_number, vat_id, created_at)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        (
+                            new_cp_id,
+                            cp_updates.get("name"),
+                            cp_updates.get("street_and_number"),
+                            cp_updates.get("address_supplement"),
+                            cp_updates.get("postcode"),
+                            cp_updates.get("city"),
+                            cp_updates.get("state"),
+                            cp_updates.get("country"),
+                            cp_updates.get("tax_number"),
+                            cp_updates.get("vat_id"),
+                            self._now(),
+                        ),
+                    )
+                    self._conn.execute(
+                        "UPDATE receipts SET counterparty_id = ? WHERE id = ?",
+                        (new_cp_id, receipt_id),
+                    )
 
-        # VAT splits — full replace when provided
-        if "vat_splits" in fields and isinstance(fields["vat_splits"], list):
-            import uuid as _uuid_vs2
-            self._exec("DELETE FROM receipt_vat_splits WHERE receipt_id = ?", (receipt_id,))
-            for pos, split in enumerate(fields["vat_splits"], start=1):
-                self._exec(
-                    """INSERT INTO receipt_vat_splits (id, receipt_id, position, vat_rate, vat_amount, net_amount)
-                       VALUES (?, ?, ?, ?, ?, ?)""",
-                    (str(_uuid_vs2.uuid4()), receipt_id,
+            # VAT splits — full replace when provided
+            if "vat_splits" in fields and isinstance(fields["vat_splits"], list):
+                split_ids = _bulk_uuids(len(fields["vat_splits"]))
+                split_rows = [
+                    (split_ids[pos - 1], receipt_id,
                      split.get("position", pos),
                      str(split["vat_rate"])    if split.get("vat_rate")    is not None else None,
                      str(split["vat_amount"])  if split.get("vat_amount")  is not None else None,
-                     str(split["net_amount"])  if split.get("net_amount")  is not None else None),
+                     str(split["net_amount"])  if split.get("net_amount")  is not None else None)
+                    for pos, split in enumerate(fields["vat_splits"], start=1)
+                ]
+                self._replace_children(
+                    receipt_id, "receipt_vat_splits",
+                    """INSERT INTO receipt_vat_splits (id, receipt_id, position, vat_rate, vat_amount, net_amount)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    split_rows,
                 )
 
-        # Counterparty verified flag
-        if "counterparty_verified" in fields and cp_id:
-            self._exec(
-                "UPDATE counterparties SET verified = ? WHERE id = ?",
-                (1 if fields["counterparty_verified"] else 0, cp_id),
-            )
+            # Counterparty verified flag
+            if "counterparty_verified" in fields and cp_id:
+                self._conn.execute(
+                    "UPDATE counterparties SET verified = ? WHERE id = ?",
+                    (1 if fields["counterparty_verified"] else 0, cp_id),
+                )
 
-        # Items — full replace when provided
-        if "items" in fields and isinstance(fields["items"], list):
-            import uuid as _uuid3
-            self._exec("DELETE FROM receipt_items WHERE receipt_id = ?", (receipt_id,))
-            for pos, item in enumerate(fields["items"], start=1):
-                self._exec(
-                    """INSERT INTO receipt_items
-                       (id, receipt_id, position, description, quantity, unit_price,
-                        total_price, vat_rate, vat_amount, category)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            # Items — full replace when provided
+            if "items" in fields and isinstance(fields["items"], list):
+                item_ids = _bulk_uuids(len(fields["items"]))
+                item_rows = [
                     (
-                        str(_uuid3.uuid4()),
+                        item_ids[pos - 1],
                         receipt_id,
                         item.get("position", pos),
                         item.get("description"),
@@ -770,7 +932,16 @@ class SQLiteRepository:
                         str(item["vat_rate"])    if item.get("vat_rate")    is not None else None,
                         str(item["vat_amount"])  if item.get("vat_amount")  is not None else None,
                         item.get("category", "other"),
-                    ),
+                    )
+                    for pos, item in enumerate(fields["items"], start=1)
+                ]
+                self._replace_children(
+                    receipt_id, "receipt_items",
+                    """INSERT INTO receipt_items
+                       (id, receipt_id, position, description, quantity, unit_price,
+                        total_price, vat_rate, vat_amount, category)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    item_rows,
                 )
 
         # Regenerate postings whenever a financially sensitive field changed
@@ -781,7 +952,7 @@ class SQLiteRepository:
 
     def list_verified_counterparties(self) -> list[dict]:
         """Return all verified counterparties sorted alphabetically by name (case-insensitive)."""
-        rows = self._conn.execute(
+        rows = self._read_conn.execute(
             """SELECT id, name, street_and_number, address_supplement,
                       postcode, city, state, country,
                       tax_number, vat_id, verified
@@ -814,7 +985,7 @@ class SQLiteRepository:
         Prefers non-'other' categories.  Returns empty dict when no receipts
         exist yet for this counterparty.
         """
-        row = self._conn.execute(
+        row = self._read_conn.execute(
             """
             SELECT category, subcategory, COUNT(*) AS cnt
             FROM   receipts
@@ -829,7 +1000,7 @@ class SQLiteRepository:
         ).fetchone()
         if row is None:
             # Fall back to any category including 'other'
-            row = self._conn.execute(
+            row = self._read_conn.execute(
                 """
                 SELECT category, subcategory, COUNT(*) AS cnt
                 FROM   receipts
@@ -856,7 +1027,7 @@ class SQLiteRepository:
 
     def list_all_counterparties(self) -> list[dict]:
         """Return every counterparty row sorted alphabetically by name (case-insensitive)."""
-        rows = self._conn.execute(
+        rows = self._read_conn.execute(
             """SELECT id, name, street_and_number, address_supplement,
                       postcode, city, state, country,
                       tax_number, vat_id, verified, created_at
@@ -937,6 +1108,12 @@ class SQLiteRepository:
         cur = self._exec("DELETE FROM counterparties WHERE id = ?", (cp_id,))
         return cur.rowcount > 0
 
+    def count(self) -> int:
+        """Number of stored receipts — COUNT(*) needs no row hydration."""
+        return self._fast_conn.execute(
+            "SELECT COUNT(*) FROM receipts"
+        ).fetchone()[0]
+
     def list_all(self) -> Iterable[ReceiptData]:
         return self._query_receipts(
             "ORDER BY receipt_date DESC NULLS LAST"
@@ -950,6 +1127,34 @@ class SQLiteRepository:
             (s, e),
         )
 
+    def has_any_in_period(self, start: date, end: date) -> bool:
+        """Cheap existence probe: is there at least one dated receipt in range?"""
+        s = (start.date() if isinstance(start, datetime) else start).isoformat()
+        e = (end.date()   if isinstance(end,   datetime) else end  ).isoformat()
+        row = self._fast_conn.execute(
+            "SELECT 1 FROM receipts WHERE receipt_date BETWEEN ? AND ? LIMIT 1",
+            (s, e),
+        ).fetchone()
+        return row is not None
+
+    def find_for_ustva(self, start: date, end: date) -> Iterable[ReceiptData]:
+        """Period receipts that can contribute to a UStVA.
+
+        Pushes the VAT filter down to SQL so rows without regular VAT or
+        import VAT are never materialized as ReceiptData.  vat_amount is
+        stored as TEXT, hence the CAST for a numeric comparison.
+        """
+        s = (start.date() if isinstance(start, datetime) else start).isoformat()
+        e = (end.date()   if isinstance(end,   datetime) else end  ).isoformat()
+        return self._query_receipts(
+            """WHERE r.receipt_date BETWEEN ? AND ?
+                 AND (CAST(r.vat_amount AS REAL) > 0
+                      OR (r.receipt_type = 'purchase'
+                          AND CAST(COALESCE(r.einfuhr_vat, '0') AS REAL) > 0))
+               ORDER BY r.receipt_date DESC""",
+            (s, e),
+        )
+
     def find_by_category(self, category: str) -> Iterable[ReceiptData]:
         return self._query_receipts(
             "WHERE r.category = ? ORDER BY r.receipt_date DESC NULLS LAST",
@@ -962,35 +1167,140 @@ class SQLiteRepository:
             (receipt_type,),
         )
 
+    @staticmethod
+    def _receipt_filters(
+        receipt_type: str | None,
+        category: str | None,
+        start: date | None,
+        end: date | None,
+    ) -> tuple[str, list]:
+        """Build the shared WHERE clause for find() / count_matching()."""
+        clauses: list[str] = []
+        params:  list = []
+        if receipt_type is not None:
+            clauses.append("r.receipt_type = ?")
+            params.append(receipt_type)
+        if category is not None:
+            clauses.append("r.category = ?")
+            params.append(category)
+        if start is not None and end is not None:
+            s = (start.date() if isinstance(start, datetime) else start).isoformat()
+            e = (end.date()   if isinstance(end,   datetime) else end  ).isoformat()
+            clauses.append("r.receipt_date BETWEEN ? AND ?")
+            params += [s, e]
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        return where, params
+
+    def find(
+        self,
+        receipt_type: str | None = None,
+        category: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Iterable[ReceiptData]:
+        """Composite filter — combines the find_by_* predicates in one WHERE.
+
+        Only rows matching every given filter are hydrated, so combined
+        queries (e.g. type + quarter) never fetch rows just to discard them
+        in Python.  ``limit``/``offset`` page the result in SQL.
+        """
+        where, params = self._receipt_filters(receipt_type, category, start, end)
+        tail = "ORDER BY r.receipt_date DESC NULLS LAST"
+        if limit is not None:
+            tail += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return self._query_receipts(where + tail, tuple(params))
+
+    def count_matching(
+        self,
+        receipt_type: str | None = None,
+        category: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> int:
+        """Row count for the same filters find() accepts — no hydration."""
+        where, params = self._receipt_filters(receipt_type, category, start, end)
+        return self._fast_conn.execute(
+            f"SELECT COUNT(*) FROM receipts r {where}", tuple(params)
+        ).fetchone()[0]
+
     # ------------------------------------------------------------------
     # Internal query helper
     # ------------------------------------------------------------------
 
     def _query_receipts(self, where_order: str, params: tuple = ()) -> list[ReceiptData]:
+        # List queries skip the receipt_content join on purpose: raw_text can
+        # be tens of KB of OCR text per receipt and no list consumer reads it
+        # (to_dict() excludes it too).  get() keeps the join for single
+        # receipts, where the caller usually does want the text.
         sql = f"""
-            SELECT r.*, rc.raw_text,
+            SELECT r.*, '' AS raw_text,
                    c.id as cp_id, c.name as cp_name,
                    c.street_and_number, c.address_supplement, c.postcode, c.city, c.state, c.country,
                    c.tax_number, c.vat_id, COALESCE(c.verified, 0) as verified
             FROM receipts r
-            LEFT JOIN receipt_content rc ON rc.receipt_id = r.id
             LEFT JOIN counterparties  c  ON c.id = r.counterparty_id
             {where_order}
         """
-        rows = self._conn.execute(sql, params).fetchall()
-        return [self._row_to_receipt(row) for row in rows]
+        rows = self._read_conn.execute(sql, params).fetchall()
+        # Batch-fetch items/vat_splits for the whole page in one query
+        # instead of one roundtrip per receipt (classic N+1).
+        children = self._fetch_children([row["id"] for row in rows])
+        return [
+            self._row_to_receipt(row, children.get(row["id"], ()))
+            for row in rows
+        ]
+
+    def _fetch_children(self, ids: list[str]) -> dict[str, list[sqlite3.Row]]:
+        """Fetch items + vat_splits rows for many receipts, grouped by id.
+
+        Uses the same UNION ALL shape as the per-receipt query in
+        _row_to_receipt; the ORDER BY keeps per-receipt ordering intact
+        when rows are grouped (stable scan order).
+        """
+        out: dict[str, list[sqlite3.Row]] = {}
+        # Each id appears twice in the IN lists; stay well under SQLite's
+        # default 999-variable limit.
+        for i in range(0, len(ids), 400):
+            chunk = ids[i:i + 400]
+            ph = ",".join("?" * len(chunk))
+            rows = self._read_conn.execute(
+                f"""SELECT receipt_id, 'i' AS k, position, description, quantity,
+                           unit_price, total_price, vat_rate, vat_amount, category,
+                           NULL AS net_amount
+                    FROM receipt_items WHERE receipt_id IN ({ph})
+                    UNION ALL
+                    SELECT receipt_id, 's', position, NULL, NULL,
+                           NULL, NULL, vat_rate, vat_amount, NULL,
+                           net_amount
+                    FROM receipt_vat_splits WHERE receipt_id IN ({ph})
+                    ORDER BY k, position ASC NULLS LAST""",
+                (*chunk, *chunk),
+            )
+            for r in rows:
+                out.setdefault(r["receipt_id"], []).append(r)
+        return out
+
+    def _row_to_receipt(
+        self, row: sqlite3.Row, child_rows: Iterable[sqlite3.Row] | None = None
+    ) -> ReceiptData:
+        # Local Decimal-or-None coercion: skips a per-call attribute lookup
+        # and any str() detour — TEXT columns already come back as str,
+        # which Decimal() accepts directly.
+        def dec(v):
+            return Decimal(v) if v is not None else None
 
-    def _row_to_receipt(self, row: sqlite3.Row) -> ReceiptData:
         # Counterparty
         cp: Counterparty | None = None
         if row["cp_id"]:
-            _cp_verified = row["verified"] if "verified" in row.keys() else 0
             cp = Counterparty(
                 id=row["cp_id"],
                 name=row["cp_name"],
                 address=Address(
                     street_and_number=row["street_and_number"],
-                    address_supplement=row["address_supplement"] if "address_supplement" in row.keys() else None,
+                    address_supplement=row["address_supplement"],
                     postcode=row["postcode"],
                     city=row["city"],
                     state=row["state"],
@@ -998,7 +1308,7 @@ class SQLiteRepository:
                 ),
                 tax_number=row["tax_number"],
                 vat_id=row["vat_id"],
-                verified=bool(_cp_verified),
+                verified=bool(row["verified"]),
             )
 
         # receipt_date
@@ -1007,38 +1317,44 @@ class SQLiteRepository:
             d = date.fromisoformat(row["receipt_date"])
             receipt_date = datetime(d.year, d.month, d.day)
 
-        # items (separate query to keep row simple)
-        item_rows = self._conn.execute(
-            "SELECT * FROM receipt_items WHERE receipt_id = ? ORDER BY position ASC NULLS LAST",
-            (row["id"],)
-        ).fetchall()
+        # items + vat_splits — one UNION ALL query with a discriminator column
+        # instead of two roundtrips; split on `k` in Python.  List queries
+        # pass the rows in prefetched (see _fetch_children).
+        if child_rows is None:
+            child_rows = self._read_conn.execute(
+                """SELECT 'i' AS k, position, description, quantity, unit_price,
+                          total_price, vat_rate, vat_amount, category,
+                          NULL AS net_amount
+                   FROM receipt_items WHERE receipt_id = ?
+                   UNION ALL
+                   SELECT 's', position, NULL, NULL, NULL,
+                          NULL, vat_rate, vat_amount, NULL,
+                          net_amount
+                   FROM receipt_vat_splits WHERE receipt_id = ?
+                   ORDER BY k, position ASC NULLS LAST""",
+                (row["id"], row["id"]),
+            ).fetchall()
         items = [
             ReceiptItem(
                 description=ir["description"] or "",
-                position=   ir["position"] if "position" in ir.keys() else None,
-                quantity=   self._dec(ir["quantity"]),
-                unit_price= self._dec(ir["unit_price"]),
-                total_price=self._dec(ir["total_price"]),
-                vat_rate=   self._dec(ir["vat_rate"]),
-                vat_amount= self._dec(ir["vat_amount"]) if "vat_amount" in ir.keys() else None,
+                position=   ir["position"],
+                quantity=   dec(ir["quantity"]),
+                unit_price= dec(ir["unit_price"]),
+                total_price=dec(ir["total_price"]),
+                vat_rate=   dec(ir["vat_rate"]),
+                vat_amount= dec(ir["vat_amount"]),
                 category=   ReceiptCategory(ir["category"] or "other"),
             )
-            for ir in item_rows
+            for ir in child_rows if ir["k"] == "i"
         ]
-
-        # vat_splits
-        split_rows = self._conn.execute(
-            "SELECT * FROM receipt_vat_splits WHERE receipt_id = ? ORDER BY position ASC",
-            (row["id"],)
-        ).fetchall()
         vat_splits = [
             {
                 "position":   sr["position"],
-                "vat_rate":   float(self._dec(sr["vat_rate"]))   if sr["vat_rate"]   else None,
-                "vat_amount": float(self._dec(sr["vat_amount"])) if sr["vat_amount"] else None,
-                "net_amount": float(self._dec(sr["net_amount"])) if sr["net_amount"] else None,
+                "vat_rate":   float(dec(sr["vat_rate"]))   if sr["vat_rate"]   else None,
+                "vat_amount": float(dec(sr["vat_amount"])) if sr["vat_amount"] else None,
+                "net_amount": float(dec(sr["net_amount"])) if sr["net_amount"] else None,
             }
-            for sr in split_rows
+            for sr in child_rows if sr["k"] == "s"
         ]
 
         receipt = ReceiptData.__new__(ReceiptData)
@@ -1049,24 +1365,23 @@ class SQLiteRepository:
         receipt.counterparty      = cp
         receipt.receipt_number    = row["receipt_number"]
         receipt.receipt_date      = receipt_date
-        receipt.total_amount      = self._dec(row["total_amount"])
-        receipt.vat_percentage    = self._dec(row["vat_percentage"])
-        receipt.vat_amount        = self._dec(row["vat_amount"])
-        receipt.currency          = row["currency"] if "currency" in row.keys() and row["currency"] else "EUR"
+        receipt.total_amount      = dec(row["total_amount"])
+        receipt.vat_percentage    = dec(row["vat_percentage"])
+        receipt.vat_amount        = dec(row["vat_amount"])
+        receipt.currency          = row["currency"] or "EUR"
         receipt.category          = ReceiptCategory(row["category"] or "other")
-        receipt.subcategory       = row["subcategory"] if "subcategory" in row.keys() else None
-        receipt.description       = row["description"] if "description" in row.keys() and row["description"] else ""
+        receipt.subcategory       = row["subcategory"]
+        receipt.description       = row["description"] or ""
         receipt.items             = items
-        # private_use_share — default to 0 for receipts created before this column existed
-        _pus = row["private_use_share"] if "private_use_share" in row.keys() else None
-        receipt.private_use_share = self._dec(_pus) or Decimal("0")
-        # validation_warnings — default to [] for receipts created before this column existed
-        _vw_raw = row["validation_warnings"] if "validation_warnings" in row.keys() else None
+        # All of these columns exist unconditionally once _migrate has run,
+        # so no per-row row.keys() probing is needed — NULLs fall back here.
+        receipt.private_use_share = dec(row["private_use_share"]) or Decimal("0")
+        _vw_raw = row["validation_warnings"]
         receipt.validation_warnings = json.loads(_vw_raw) if _vw_raw else []
         # created_at — when the receipt was first stored (UTC ISO-8601 string)
-        receipt.created_at = row["created_at"] if "created_at" in row.keys() else None
+        receipt.created_at = row["created_at"]
         # einfuhr_vat — Einfuhrumsatzsteuer (§ 15 Abs. 1 Satz 1 Nr. 2 UStG)
-        receipt.einfuhr_vat = self._dec(row["einfuhr_vat"]) if "einfuhr_vat" in row.keys() else None
+        receipt.einfuhr_vat = dec(row["einfuhr_vat"])
         return receipt
 
     # ------------------------------------------------------------------
@@ -1075,10 +1390,9 @@ class SQLiteRepository:
 
     def get_metadata(self, key: str) -> dict | None:
         """Return the parsed JSON value for *key*, or None if not set."""
-        with self._lock:
-            row = self._conn.execute(
-                "SELECT value FROM project_metadata WHERE key = ?", (key,)
-            ).fetchone()
+        row = self._read_conn.execute(
+            "SELECT value FROM project_metadata WHERE key = ?", (key,)
+        ).fetchone()
         if row is None:
             return None
         try:
@@ -1089,7 +1403,7 @@ class SQLiteRepository:
     def set_metadata(self, key: str, value: dict) -> None:
         """Upsert *key* with the JSON-serialised *value*."""
         now = datetime.now(timezone.utc).isoformat()
-        with self._lock:
+        with self._write_lock:
             self._conn.execute(
                 """
                 INSERT INTO project_metadata (key, value, updated_at)
@@ -1102,7 +1416,7 @@ class SQLiteRepository:
 
     def delete_metadata(self, key: str) -> None:
         """Remove *key* from project_metadata (no-op if absent)."""
-        with self._lock:
+        with self._write_lock:
             self._conn.execute(
                 "DELETE FROM project_metadata WHERE key = ?", (key,)
             )
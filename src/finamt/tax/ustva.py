@@ -32,11 +32,13 @@ Usage::
 from __future__ import annotations
 
 import json
+import numpy as np
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal, ROUND_HALF_UP
+from functools import cached_property
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, NamedTuple
 
 from ..models import ReceiptData
 
@@ -48,10 +50,53 @@ def _r(d: Decimal) -> Decimal:
     return d.quantize(_TWO, rounding=ROUND_HALF_UP)
 
 
+def _cents(d: Decimal) -> int:
+    """Exact int64-cent representation of an already-quantized amount."""
+    return int(_r(d) * 100)
+
+
+def _from_cents(c: int) -> Decimal:
+    """Inverse of :func:`_cents` — always carries two decimal places."""
+    return Decimal(c).scaleb(-2)
+
+
+def _aggregate(code_arr, vat_arr, net_arr, p_mask, n_rates):
+    """Sum cent columns per rate code, split by purchase/sale.
+
+    Pure array kernel over the SoA columns built by :func:`generate_ustva`;
+    isolated so the summation strategy can be swapped without touching the
+    streaming/skip logic around it.
+    """
+    s_mask = ~p_mask
+    # float64 weights represent cent integers exactly up to 2**53
+    # (~90 trillion EUR) — sums stay exact.
+    p_vat = np.bincount(code_arr[p_mask], weights=vat_arr[p_mask], minlength=n_rates)
+    p_net = np.bincount(code_arr[p_mask], weights=net_arr[p_mask], minlength=n_rates)
+    s_vat = np.bincount(code_arr[s_mask], weights=vat_arr[s_mask], minlength=n_rates)
+    s_net = np.bincount(code_arr[s_mask], weights=net_arr[s_mask], minlength=n_rates)
+    p_cnt = np.bincount(code_arr[p_mask], minlength=n_rates)
+    s_cnt = np.bincount(code_arr[s_mask], minlength=n_rates)
+    return p_vat, p_net, s_vat, s_net, p_cnt, s_cnt
+
+
 def _to_date(dt: date | datetime) -> date:
     return dt.date() if isinstance(dt, datetime) else dt
 
 
+# Rendered once per rate in USTVAReport.summary(); a single template keeps
+# the format specs parsed once per call instead of once per fragment.
+_LINE_TMPL = (
+    "  USt-Satz {rate} %\n"
+    "    Einkauf (Vorsteuer)\n"
+    "      Nettobetrag    : {pn:>10.2f} EUR  ({pc} Belege)\n"
+    "      Vorsteuer      : {pv:>10.2f} EUR\n"
+    "    Verkauf (Umsatzsteuer)\n"
+    "      Nettobetrag    : {sn:>10.2f} EUR  ({sc} Belege)\n"
+    "      Umsatzsteuer   : {sv:>10.2f} EUR\n"
+    "      Saldo          : {saldo:>+10.2f} EUR"
+)
+
+
 # ---------------------------------------------------------------------------
 # Per-rate line
 # ---------------------------------------------------------------------------
@@ -92,6 +137,15 @@ class USTVALineItem:
 # Report
 # ---------------------------------------------------------------------------
 
+class _Totals(NamedTuple):
+    """Report-wide sums, computed once per report (see USTVAReport._totals)."""
+    input_vat:    Decimal
+    output_vat:   Decimal
+    purchase_net: Decimal
+    sale_net:     Decimal
+    receipts:     int
+
+
 @dataclass
 class USTVAReport:
     """
@@ -113,32 +167,56 @@ class USTVAReport:
     # Aggregated totals
     # ------------------------------------------------------------------
 
+    @cached_property
+    def _totals(self) -> _Totals:
+        """All report-wide sums in one place.
+
+        summary() and to_dict() read every total, and each property used to
+        re-iterate the lines — six redundant passes per render.  The report
+        is not mutated after generation, so memoize on first access.
+        """
+        pv = sv = pn = sn = Decimal("0")
+        count = 0
+        for ln in self.lines.values():
+            pv += ln.purchase_vat
+            sv += ln.sale_vat
+            pn += ln.purchase_net
+            sn += ln.sale_net
+            count += ln.purchase_count + ln.sale_count
+        return _Totals(
+            input_vat=pv + self.einfuhr_vat,
+            output_vat=sv,
+            purchase_net=pn,
+            sale_net=sn,
+            receipts=count,
+        )
+
     @property
     def total_input_vat(self) -> Decimal:
         """Total Vorsteuer across all rates (from purchases) + Einfuhrumsatzsteuer."""
-        return sum((ln.purchase_vat for ln in self.lines.values()), Decimal("0")) + self.einfuhr_vat
+        return self._totals.input_vat
 
     @property
     def total_output_vat(self) -> Decimal:
         """Total Umsatzsteuer across all rates (from sales)."""
-        return sum((ln.sale_vat for ln in self.lines.values()), Decimal("0"))
+        return self._totals.output_vat
 
     @property
     def net_liability(self) -> Decimal:
         """output − input. Positive = you owe; negative = refund."""
-        return self.total_output_vat - self.total_input_vat
+        return self._totals.output_vat - self._totals.input_vat
 
     @property
     def total_purchase_net(self) -> Decimal:
-        return sum((ln.purchase_net for ln in self.lines.values()), Decimal("0"))
+        return self._totals.purchase_net
 
     @property
     def total_sale_net(self) -> Decimal:
-        return sum((ln.sale_net for ln in self.lines.values()), Decimal("0"))
+        return self._totals.sale_net
 
     @property
     def total_receipts(self) -> int:
-        return sum(ln.purchase_count + ln.sale_count for ln in self.lines.values())
+        return self._totals.receipts
 
     # Convenience accessors
     @property
@@ -165,7 +243,7 @@ class USTVAReport:
             "total_sale_net":    str(self.total_sale_net),
             "total_output_vat":  str(self.total_output_vat),
             "net_liability":     str(self.net_liability),
-            "lines":             {k: v.to_dict() for k, v in sorted(self.lines.items())},
+            "lines":             {k: v.to_dict() for k, v in self.lines.items()},
         }
 
     def to_json(self, path: str | Path | None = None) -> str:
@@ -196,17 +274,15 @@ class USTVAReport:
 
         if self.lines:
             lines.append(div)
-            for rate_key, ln in sorted(self.lines.items()):
-                lines += [
-                    f"  USt-Satz {ln.vat_rate} %",
-                    f"    Einkauf (Vorsteuer)",
-                    f"      Nettobetrag    : {ln.purchase_net:>10.2f} EUR  ({ln.purchase_count} Belege)",
-                    f"      Vorsteuer      : {ln.purchase_vat:>10.2f} EUR",
-                    f"    Verkauf (Umsatzsteuer)",
-                    f"      Nettobetrag    : {ln.sale_net:>10.2f} EUR  ({ln.sale_count} Belege)",
-                    f"      Umsatzsteuer   : {ln.sale_vat:>10.2f} EUR",
-                    f"      Saldo          : {ln.net_liability:>+10.2f} EUR",
-                ]
+            lines += [
+                _LINE_TMPL.format(
+                    rate=ln.vat_rate,
+                    pn=ln.purchase_net, pc=ln.purchase_count, pv=ln.purchase_vat,
+                    sn=ln.sale_net, sc=ln.sale_count, sv=ln.sale_vat,
+                    saldo=ln.net_liability,
+                )
+                for ln in self.lines.values()
+            ]
 
         lines += [hdiv]
         if self.einfuhr_vat > 0:
@@ -244,59 +320,121 @@ def generate_ustva(
     start = _to_date(period_start)
     end   = _to_date(period_end)
 
-    for r in receipts:
-        if r.receipt_date is None:
-            report.skipped_count += 1
-            continue
-        if not (start <= _to_date(r.receipt_date) <= end):
-            report.skipped_count += 1
-            continue
-
-        has_vat     = bool(r.vat_amount and r.vat_amount > 0)
-        ev          = getattr(r, "einfuhr_vat", None)
-        has_einfuhr = bool(r.is_purchase and ev and ev > 0)
-
-        if not has_vat and not has_einfuhr:
-            report.skipped_count += 1
-            continue
-
-        # Einfuhrumsatzsteuer — track at report level (not per-rate line)
-        if has_einfuhr:
-            report.einfuhr_vat += _r(ev)
-
-        # Per-rate regular VAT lines
-        if not has_vat:
-            continue
+    recs = receipts if isinstance(receipts, list) else list(receipts)
+    if not recs:
+        return report
+
+    # Vectorized validity filtering: build per-receipt columns once, then one
+    # fused boolean pass replaces the three Python branches per receipt.
+    # Missing dates become NaT and fail every comparison.
+    date_list: list[date | None] = []
+    for r in recs:
+        rd = r.receipt_date
+        if type(rd) is datetime:
+            rd = rd.date()
+        date_list.append(rd)
+    dates = np.array(date_list, dtype="datetime64[D]")
+    n = len(recs)
+    has_vat = np.fromiter(
+        (r.vat_amount is not None and r.vat_amount > 0 for r in recs),
+        dtype=bool, count=n,
+    )
+    has_einfuhr = np.fromiter(
+        (bool(r.is_purchase and (getattr(r, "einfuhr_vat", None) or 0) > 0) for r in recs),
+        dtype=bool, count=n,
+    )
+    in_period = (
+        ~np.isnat(dates)
+        & (dates >= np.datetime64(start))
+        & (dates <= np.datetime64(end))
+    )
+    counted = in_period & (has_vat | has_einfuhr)
+    report.skipped_count = int(n - counted.sum())
+
+    # Einfuhrumsatzsteuer — track at report level (not per-rate line)
+    for i in np.nonzero(in_period & has_einfuhr)[0]:
+        report.einfuhr_vat += _r(recs[i].einfuhr_vat)
+
+    # Second pass over the survivors only: quantize each receipt once
+    # (ROUND_HALF_UP, exact) and collect int64-cent columns (structure of
+    # arrays) plus a rate code per receipt; the per-rate summation then runs
+    # vectorized instead of one Decimal.__add__ per receipt.
+    # Pre-seed the rate codes every German UStVA actually uses (19/7/0) so
+    # the common case never pays the miss branch; rarer rates still get
+    # appended on first sight.  Lines are only emitted for codes that saw
+    # at least one receipt.
+    rate_codes: dict[str, int] = {"19": 0, "7": 1, "0": 2}
+    rate_vals:  list[Decimal] = [Decimal("19"), Decimal("7"), Decimal("0")]
+    # normalize() costs ~1 µs per call and the domain is a handful of rates —
+    # memoize both the normalized value and its string key per unique input.
+    norm_cache: dict[Decimal, tuple[str, Decimal]] = {}
+    codes:          list[int]  = []
+    vat_cents:      list[int]  = []
+    net_cents:      list[int]  = []
+    purchase_flags: list[bool] = []
+
+    for i in np.nonzero(in_period & has_vat)[0]:
+        r = recs[i]
 
         # Rate key
-        rate_key = str(r.vat_percentage.normalize()) if r.vat_percentage else "unknown"
-        if rate_key not in report.lines:
-            report.lines[rate_key] = USTVALineItem(
-                vat_rate=r.vat_percentage.normalize() if r.vat_percentage else Decimal("0")
-            )
-
-        ln = report.lines[rate_key]
+        vp = r.vat_percentage
+        if vp:
+            cached = norm_cache.get(vp)
+            if cached is None:
+                nv = vp.normalize()
+                cached = norm_cache[vp] = (str(nv), nv)
+            rate_key, rate_val = cached
+        else:
+            rate_key, rate_val = "unknown", Decimal("0")
+        code = rate_codes.get(rate_key)
+        if code is None:
+            code = len(rate_vals)
+            rate_codes[rate_key] = code
+            rate_vals.append(rate_val)
 
         if r.is_purchase:
             # Only the *business* portion is tax-deductible.
             # business_vat / business_net already apply (1 - private_use_share).
-            vat = _r(r.business_vat if r.business_vat is not None else r.vat_amount)
-            net = _r(r.business_net if r.business_net is not None else (r.net_amount or Decimal("0")))
-            ln.purchase_vat += vat
-            ln.purchase_net += net
-            ln.purchase_count += 1
+            vat = r.business_vat if r.business_vat is not None else r.vat_amount
+            net = r.business_net if r.business_net is not None else (r.net_amount or Decimal("0"))
         else:  # sale — private_use_share does not reduce output VAT
-            vat = _r(r.vat_amount)
-            net = _r(r.net_amount or Decimal("0"))
-            ln.sale_vat += vat
-            ln.sale_net += net
-            ln.sale_count += 1
-
-    # Final rounding pass
-    for ln in report.lines.values():
-        ln.purchase_vat = _r(ln.purchase_vat)
-        ln.purchase_net = _r(ln.purchase_net)
-        ln.sale_vat     = _r(ln.sale_vat)
-        ln.sale_net     = _r(ln.sale_net)
+            vat = r.vat_amount
+            net = r.net_amount or Decimal("0")
+
+        codes.append(code)
+        vat_cents.append(_cents(vat))
+        net_cents.append(_cents(net))
+        purchase_flags.append(r.is_purchase)
+
+    if codes:
+        n_rates = len(rate_vals)
+        p_vat, p_net, s_vat, s_net, p_cnt, s_cnt = _aggregate(
+            np.asarray(codes, dtype=np.int64),
+            np.asarray(vat_cents, dtype=np.int64),
+            np.asarray(net_cents, dtype=np.int64),
+            np.asarray(purchase_flags, dtype=bool),
+            n_rates,
+        )
+
+        for rate_key, code in rate_codes.items():
+            if not (p_cnt[code] or s_cnt[code]):
+                continue
+            report.lines[rate_key] = USTVALineItem(
+                vat_rate=rate_vals[code],
+                purchase_net=_from_cents(int(p_net[code])),
+                purchase_vat=_from_cents(int(p_vat[code])),
+                purchase_count=int(p_cnt[code]),
+                sale_net=_from_cents(int(s_net[code])),
+                sale_vat=_from_cents(int(s_vat[code])),
+                sale_count=int(s_cnt[code]),
+            )
+
+        # No final rounding pass: every addend was quantized to two decimal
+        # places on ingress, and sums of 2-dp values are themselves 2-dp
+        # (_r(a) + _r(b) == _r(_r(a) + _r(b)) by construction).
+
+        # Keep lines pre-sorted by rate key so renderers can iterate in
+        # insertion order instead of re-sorting on every to_dict()/summary().
+        report.lines = dict(sorted(report.lines.items()))
 
     return report
\ No newline at end of file
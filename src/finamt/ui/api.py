@@ -37,18 +37,37 @@ from __future__ import annotations
 
 import asyncio
 import json
-import tempfile
+import os
+import queue as queuelib
+import threading
+import time
 import urllib.request
 from datetime import date
+from email.utils import formatdate
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Annotated, Optional
 
-from fastapi import Body, FastAPI, File, HTTPException, Query, UploadFile, status
+from fastapi import Body, FastAPI, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import BaseModel
 
+try:
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+    import orjson as _orjson
+
+    def _json_dumps(obj) -> str:
+        return _orjson.dumps(obj).decode()
+except ImportError:  # orjson not installed — fall back to stdlib json
+    _DefaultResponse = JSONResponse
+    _json_dumps = json.dumps
+
 # ---------------------------------------------------------------------------
 # finamt integration
 # ---------------------------------------------------------------------------
@@ -91,10 +110,17 @@ except ImportError as _import_err:
 _DEFAULT_LAYOUT = resolve_project(DEFAULT_PROJECT)
 _DEFAULT_DB     = _DEFAULT_LAYOUT.db_path
 
-ALLOWED_MIME_TYPES = {
-    "image/jpeg", "image/png", "image/webp",
-    "image/tiff", "application/pdf",
+# Accepted upload content types, mapped straight to the storage suffix —
+# one dict lookup replaces both the membership test set and per-request
+# filename parsing.
+_MIME_TO_SUFFIX = {
+    "image/jpeg":      ".jpg",
+    "image/png":       ".png",
+    "image/webp":      ".webp",
+    "image/tiff":      ".tif",
+    "application/pdf": ".pdf",
 }
+ALLOWED_MIME_TYPES = frozenset(_MIME_TO_SUFFIX)
 
 # Maps file extension → MIME type for serving stored originals
 _EXT_MIME: dict[str, str] = {
@@ -109,6 +135,19 @@ _EXT_MIME: dict[str, str] = {
 # Extensions to probe when looking for a stored receipt file
 _STORED_EXTS = list(_EXT_MIME.keys())
 
+# Calendar quarter boundaries as (month, day) — indexed by quarter-1
+_Q_START = ((1, 1), (4, 1), (7, 1), (10, 1))
+_Q_END   = ((3, 31), (6, 30), (9, 30), (12, 31))
+
+
+@lru_cache(maxsize=64)
+def _quarter_bounds(year: int, quarter: int) -> tuple[date, date]:
+    """First and last day of a calendar quarter (memoized — a handful of
+    (year, quarter) pairs cover all real traffic)."""
+    ms, ds = _Q_START[quarter - 1]
+    me, de = _Q_END[quarter - 1]
+    return date(year, ms, ds), date(year, me, de)
+
 # ---------------------------------------------------------------------------
 # App
 # ---------------------------------------------------------------------------
@@ -117,8 +156,15 @@ app = FastAPI(
     title="finamt API",
     version="0.2.0",
     license_info={"name": "MIT"},
+    # orjson writes response bytes in C — a large receipt list serializes
+    # several times faster than through the stdlib json encoder.
+    default_response_class=_DefaultResponse,
 )
 
+# Receipt lists are highly repetitive JSON and compress 5-10x; the 1 KiB
+# floor keeps small responses (health, config) uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origin_regex=r"https?://(localhost|127\.0\.0\.1)(:\d+)?",
@@ -131,11 +177,16 @@ app.add_middleware(
 # Helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=64)
 def _resolve_layout(db: Optional[str], project: Optional[str] = None):
     """
     Resolve a ProjectLayout from either an explicit db path or a project name.
     Priority: explicit db path > project name > "default".
     Always returns a proper ProjectLayout — never the old flat path.
+
+    Memoized per (db, project) string: resolution is pure path arithmetic
+    and every request repeats the same handful of values.  Errors (bad
+    suffix) are raised, not cached, so lru_cache never pins a failure.
     """
     if db:
         p = Path(db)
@@ -150,19 +201,168 @@ def _resolve_db(db: Optional[str]) -> Path:
     return _resolve_layout(db).db_path
 
 
+@lru_cache(maxsize=32)
 def _pdf_dir(db_path: Path) -> Path:
-    """PDFs live in pdfs/ inside the project root (sibling of finamt.db)."""
+    """PDFs live in pdfs/ inside the project root (sibling of finamt.db).
+
+    Memoized: layout derivation is pure path arithmetic and get_receipt /
+    the pdf endpoint re-derive it for the same handful of db paths."""
     layout = layout_from_db_path(db_path)
     return layout.pdfs_dir if layout else db_path.parent / "pdfs"
 
 
-def _repo(db_path: Path) -> SQLiteRepository:
+# Per-database pools of idle repositories.  Opening a SQLiteRepository costs
+# a file open, pragma setup and migration checks per request; leasing a
+# long-lived instance turns that into a queue pop.
+_POOL_MAX = 4
+_pools: dict[Path, queuelib.Queue] = {}
+# Inode of the db file each pool was built against — if it changes (project
+# deleted and recreated), the pooled connections point at a ghost file and
+# must be thrown away.
+_pool_inos: dict[Path, int] = {}
+_pools_lock = threading.Lock()
+
+
+class _RepoLease:
+    """Context manager leasing a SQLiteRepository from the per-db pool.
+
+    On exit the repository goes back to the pool (or is closed when the
+    pool is full) instead of being torn down.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+
+    def __enter__(self) -> SQLiteRepository:
+        try:
+            ino = os.stat(self._db_path).st_ino
+        except OSError:
+            ino = 0
+        stale = None
+        with _pools_lock:
+            if _pool_inos.get(self._db_path, ino) != ino:
+                stale = _pools.pop(self._db_path, None)
+            _pool_inos[self._db_path] = ino
+            self._pool = _pools.setdefault(
+                self._db_path, queuelib.Queue(maxsize=_POOL_MAX)
+            )
+        while stale is not None:
+            try:
+                stale.get_nowait().close()
+            except queuelib.Empty:
+                break
+        try:
+            self._repo = self._pool.get_nowait()
+        except queuelib.Empty:
+            self._repo = SQLiteRepository(db_path=self._db_path)
+        return self._repo
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Never pool a repo with an open transaction: a handler that raised
+        # mid-write would otherwise park the SQLite write lock in the pool
+        # (blocking every other writer) and the dangling rows would be
+        # committed by whoever leases the repo next.  Rollback is a no-op
+        # on a clean connection.
+        self._repo._conn.rollback()
+        try:
+            self._pool.put_nowait(self._repo)
+        except queuelib.Full:
+            self._repo.close()
+
+
+def _drop_pool(db_path: Path) -> None:
+    """Close and forget pooled repositories for *db_path* (project deleted)."""
+    with _pools_lock:
+        pool = _pools.pop(db_path, None)
+        _pool_inos.pop(db_path, None)
+    while pool is not None:
+        try:
+            pool.get_nowait().close()
+        except queuelib.Empty:
+            break
+
+
+# Dedicated bounded executor for extraction work.  OCR/LLM jobs run for
+# seconds each; on the shared anyio threadpool they would pin slots that
+# interactive list/get handlers need, so they get their own small pool.
+_agent_pool = None
+_agent_pool_lock = threading.Lock()
+
+
+def _agent_executor():
+    global _agent_pool
+    if _agent_pool is None:
+        with _agent_pool_lock:
+            if _agent_pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _agent_pool = ThreadPoolExecutor(
+                    max_workers=max(2, (os.cpu_count() or 2) // 2),
+                    thread_name_prefix="finamt-agent",
+                )
+    return _agent_pool
+
+
+def _drain_pools() -> None:
+    """Close every pooled repository (server shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        while True:
+            try:
+                pool.get_nowait().close()
+            except queuelib.Empty:
+                break
+
+
+@app.on_event("startup")
+async def _maybe_open_browser() -> None:
+    # Set by server.launch(); opening from here (instead of a sleeping
+    # thread in the launcher) means the tab appears once the loop is
+    # actually serving, with no extra thread and no duplicate tab from
+    # the --reload supervisor process.
+    if os.environ.pop("FINAMT_OPEN_BROWSER", None) == "1":
+        import webbrowser
+        url = os.environ.get("FINAMT_URL", "http://127.0.0.1:8000")
+        asyncio.get_running_loop().call_later(1.0, webbrowser.open, url)
+
+
+@app.on_event("startup")
+async def _widen_threadpool() -> None:
+    # Starlette's default thread limiter (40 tokens) caps every sync
+    # handler and run_in_threadpool call in the process; with per-project
+    # fan-out on /projects plus extraction jobs, give it more headroom.
+    try:
+        import anyio.to_thread
+        anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+    except ImportError:
+        pass
+
+
+@app.on_event("shutdown")
+def _close_pools_on_shutdown() -> None:
+    _drain_pools()
+    if _agent_pool is not None:
+        _agent_pool.shutdown(wait=False)
+
+
+def _repo(db_path: Path) -> _RepoLease:
     if not _LIB_AVAILABLE:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="finamt library not installed.",
         )
-    return SQLiteRepository(db_path=db_path)
+    return _RepoLease(db_path)
+
+
+
+def _pending_upload_path(layout, suffix: str) -> Path:
+    """Target path for a streamed upload, pre-placed in the project's pdfs
+    dir so the post-extraction store is an atomic rename instead of a second
+    full-file write (see FinanceAgent._store_pdf)."""
+    import uuid
+    layout.pdfs_dir.mkdir(parents=True, exist_ok=True)
+    return layout.pdfs_dir / f"_pending_{uuid.uuid4().hex}{suffix}"
 
 
 def _require_db(db_path: Path) -> None:
@@ -187,25 +387,63 @@ def _find_stored_file(receipt_id: str, db_path: Path) -> Optional[Path]:
     return None
 
 
-def _receipt_to_response(r, db_path: Path) -> dict:
+def _existing_pdf_ids(db_path: Path) -> set[str]:
+    """Stems of all stored originals — one readdir instead of a stat() per
+    receipt when serialising lists.  os.scandir avoids building a Path
+    object per entry; names are split with os.path.splitext instead."""
+    try:
+        with os.scandir(_pdf_dir(db_path)) as entries:
+            ids = set()
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext in _EXT_MIME:
+                    ids.add(stem)
+            return ids
+    except OSError:
+        return set()
+
+
+def _receipt_to_response(r, db_path: Path, pdf_ids: Optional[set[str]] = None) -> dict:
     d = r.to_dict()
-    stored = _find_stored_file(r.id, db_path)
-    d["pdf_url"] = f"/receipts/{r.id}/pdf" if stored else None
+    if pdf_ids is not None:
+        has_pdf = r.id in pdf_ids
+    else:
+        has_pdf = _find_stored_file(r.id, db_path) is not None
+    d["pdf_url"] = f"/receipts/{r.id}/pdf" if has_pdf else None
     return d
 
 
+@lru_cache(maxsize=64)
+def _count_receipts(db_path: str, mtime_ns: int) -> int:
+    """COUNT(*) for one project db, memoized per (path, mtime).
+
+    Opening the full repository would run migration checks per project per
+    listing; a raw read-only connection just counts.  The mtime key makes
+    any write to the db a cache miss, so counts are never stale.
+    """
+    import sqlite3
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM receipts").fetchone()[0]
+        finally:
+            conn.close()
+    except Exception:
+        return 0
+
+
 def _project_entry(layout, active_db: Optional[str] = None) -> dict:
     """Serialise a ProjectLayout to a JSON-safe dict."""
     receipt_count = 0
     size_kb = 0.0
-    if layout.db_path.exists():
-        size_kb = round(layout.db_path.stat().st_size / 1024, 1)
+    try:
+        st = layout.db_path.stat()
+    except OSError:
+        st = None
+    if st is not None:
+        size_kb = round(st.st_size / 1024, 1)
         if _LIB_AVAILABLE:
-            try:
-                with SQLiteRepository(db_path=layout.db_path) as repo:
-                    receipt_count = sum(1 for _ in repo.list_all())
-            except Exception:
-                pass
+            receipt_count = _count_receipts(str(layout.db_path), st.st_mtime_ns)
     is_active = (
         active_db == str(layout.db_path)
         or (active_db is None and layout.is_default)
@@ -218,7 +456,7 @@ def _project_entry(layout, active_db: Optional[str] = None) -> dict:
         "receipts":   receipt_count,
         "is_default": layout.is_default,
         "is_active":  is_active,
-        "exists":     layout.db_path.exists(),
+        "exists":     st is not None,
     }
 
 
@@ -226,14 +464,59 @@ def _project_entry(layout, active_db: Optional[str] = None) -> dict:
 # Meta
 # ---------------------------------------------------------------------------
 
+def _ttl_cache(seconds: float):
+    """Memoize a zero-argument function for *seconds*.
+
+    /health and /config are hit by liveness probes every few seconds; their
+    answers change rarely, so a short TTL trades staleness measured in
+    seconds for skipping the stat syscall / config rebuild per probe.
+    """
+    def decorator(fn):
+        cached: tuple[float, object] | None = None
+
+        @wraps(fn)
+        def wrapper():
+            nonlocal cached
+            now = time.monotonic()
+            if cached is None or now - cached[0] >= seconds:
+                cached = (now, fn())
+            return cached[1]
+
+        return wrapper
+    return decorator
+
+
+@_ttl_cache(seconds=5)
+def _default_db_exists() -> bool:
+    return _DEFAULT_DB.exists()
+
+
+def _payload_etag(obj) -> str:
+    """Deterministic ETag for a JSON-safe payload (polling endpoints)."""
+    import hashlib
+    return '"' + hashlib.blake2b(repr(obj).encode(), digest_size=8).hexdigest() + '"'
+
+
+def _etagged(payload, request: Request):
+    """Reply 304 when the client already holds this payload, else attach
+    the ETag so its next poll can."""
+    etag = _payload_etag(payload)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                        headers={"ETag": etag})
+    return _DefaultResponse(
+        payload, headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+
 @app.get("/health", tags=["meta"])
-def health():
-    return {
+def health(request: Request):
+    return _etagged({
         "status":            "ok",
         "library_available": _LIB_AVAILABLE,
         "db_path":           str(_DEFAULT_DB),
-        "db_exists":         _DEFAULT_DB.exists(),
-    }
+        "db_exists":         _default_db_exists(),
+    }, request)
 
 
 @app.get("/fx-rate", tags=["meta"])
@@ -255,8 +538,11 @@ def fx_rate(from_currency: str = Query(..., alias="from"), to: str = "EUR", date
     return {"base": from_currency.upper(), "to": to.upper(), "rate": rate, "date": data.get("date")}
 
 
-@app.get("/config", tags=["meta"])
-def get_config():
+# Config is static for the lifetime of the process (model settings are read
+# from disk once at import), so a long TTL is safe; health keeps 5 s because
+# db_exists flips when the first upload creates the database.
+@_ttl_cache(seconds=60)
+def _config_payload() -> dict:
     if not _LIB_AVAILABLE or _cfg is None:
         return {"error": "finamt library not available", "categories": RECEIPT_CATEGORIES}
     mc = _cfg.get_model_config()
@@ -270,19 +556,73 @@ def get_config():
     }
 
 
+@app.get("/config", tags=["meta"])
+def get_config(request: Request):
+    return _etagged(_config_payload(), request)
+
+
 # ---------------------------------------------------------------------------
 # Projects
 # ---------------------------------------------------------------------------
 
+# /projects response cache: recomputing means opening every project DB.
+# Keyed on each db file's (path, mtime, size) so any write invalidates,
+# with a short TTL so the stat pass itself is also amortized.
+_PROJECT_CACHE: dict = {"key": None, "at": 0.0, "payload": None}
+_PROJECT_CACHE_TTL = 5.0
+
+
+def _project_cache_key(projects, active_db: Optional[str]) -> tuple:
+    parts = [active_db]
+    for layout in projects:
+        try:
+            st = layout.db_path.stat()
+            parts.append((str(layout.db_path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            parts.append((str(layout.db_path), None, None))
+    return tuple(parts)
+
+
 @app.get("/projects", tags=["projects"])
-def list_projects_endpoint(active_db: Optional[str] = Query(default=None)):
+async def list_projects_endpoint(
+    request: Request, active_db: Optional[str] = Query(default=None)
+):
     """
     List all projects under ~/.finamt/.
     Each project is a subdirectory containing finamt.db.
     """
-    projects = list_projects()
+    projects = await run_in_threadpool(list_projects)
+    key = await run_in_threadpool(_project_cache_key, projects, active_db)
+    # The cache key already captures every db's (path, mtime, size), so it
+    # doubles as the ETag source: a 304 here skips payload building AND the
+    # response body.
+    etag = _payload_etag(key)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                        headers={"ETag": etag})
+    now = time.monotonic()
+    if (
+        _PROJECT_CACHE["payload"] is not None
+        and _PROJECT_CACHE["key"] == key
+        and now - _PROJECT_CACHE["at"] < _PROJECT_CACHE_TTL
+    ):
+        payload = _PROJECT_CACHE["payload"]
+    else:
+        payload = await _build_projects_payload(projects, active_db)
+        _PROJECT_CACHE.update(key=key, at=now, payload=payload)
+    return _DefaultResponse(
+        payload, headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+
+async def _build_projects_payload(projects, active_db: Optional[str]) -> dict:
+    # Each entry counts rows in a different database file — independent
+    # work, so fan it out across the threadpool instead of serializing.
+    entries = await asyncio.gather(
+        *[run_in_threadpool(_project_entry, p, active_db) for p in projects]
+    )
     return {
-        "projects":    [_project_entry(p, active_db) for p in projects],
+        "projects":    list(entries),
         "finamt_home": str(FINAMT_HOME),
         "default_db":  str(_DEFAULT_DB),
     }
@@ -315,6 +655,7 @@ def create_project(body: dict = Body(...)):
         except Exception as exc:
             raise HTTPException(status_code=500, detail=f"DB init failed: {exc}") from exc
 
+    _resolve_layout.cache_clear()
     return _project_entry(layout)
 
 
@@ -333,6 +674,11 @@ def delete_project(name: str, keep_pdfs: bool = Query(default=True)):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found.")
 
     import shutil
+    _drop_pool(layout.db_path)
+    # Drop memoized resolutions pointing at the deleted project so a
+    # later re-create starts from a clean slate.
+    _resolve_layout.cache_clear()
+    _pdf_dir.cache_clear()
     layout.db_path.unlink(missing_ok=True)
     if layout.debug_dir.exists():
         shutil.rmtree(layout.debug_dir, ignore_errors=True)
@@ -347,9 +693,9 @@ def delete_project(name: str, keep_pdfs: bool = Query(default=True)):
 
 # Legacy alias — the frontend used /databases before the project refactor
 @app.get("/databases", tags=["projects"])
-def list_databases(active_db: Optional[str] = Query(default=None)):
+async def list_databases(request: Request, active_db: Optional[str] = Query(default=None)):
     """Legacy alias for GET /projects — kept for backwards compatibility."""
-    return list_projects_endpoint(active_db=active_db)
+    return await list_projects_endpoint(request, active_db=active_db)
 
 
 # ---------------------------------------------------------------------------
@@ -514,9 +860,14 @@ async def upload_receipt_stream(
 
     layout  = _resolve_layout(db)
     db_path = layout.db_path
-    suffix  = Path(file.filename or "receipt").suffix or ".pdf"
+    suffix  = _MIME_TO_SUFFIX[file.content_type]
 
-    file_bytes = await file.read()
+    # Stream to disk in 64 KB chunks (same as the non-streaming endpoint):
+    # the upload never sits fully in RAM and the loop yields between chunks.
+    tmp_path = _pending_upload_path(layout, suffix)
+    with tmp_path.open("wb") as out:
+        while chunk := await file.read(1 << 16):
+            out.write(chunk)
 
     loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
     queue: asyncio.Queue[str | None] = asyncio.Queue()
@@ -539,10 +890,6 @@ async def upload_receipt_stream(
         }
 
     def _run() -> None:
-        import tempfile as _tf
-        with _tf.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            tmp.write(file_bytes)
-            tmp_path = Path(tmp.name)
         try:
             _progress.set_callback(
                 lambda msg: loop.call_soon_threadsafe(queue.put_nowait, msg)
@@ -573,11 +920,11 @@ async def upload_receipt_stream(
             response["message"] = "A receipt with identical content already exists."
         loop.call_soon_threadsafe(
             queue.put_nowait,
-            f"__result__:{json.dumps(response)}",
+            f"__result__:{_json_dumps(response)}",
         )
         loop.call_soon_threadsafe(queue.put_nowait, None)
 
-    loop.run_in_executor(None, _run)
+    loop.run_in_executor(_agent_executor(), _run)
 
     async def _event_stream():
         while True:
@@ -590,9 +937,9 @@ async def upload_receipt_stream(
                 break
             if item.startswith("__error__:"):
                 payload = item[len("__error__:"):]
-                yield f"event: error\ndata: {json.dumps(payload)}\n\n"
+                yield f"event: error\ndata: {_json_dumps(payload)}\n\n"
                 break
-            yield f"event: progress\ndata: {json.dumps(item)}\n\n"
+            yield f"event: progress\ndata: {_json_dumps(item)}\n\n"
 
     return StreamingResponse(
         _event_stream(),
@@ -620,18 +967,26 @@ async def upload_receipt(
 
     layout  = _resolve_layout(db)
     db_path = layout.db_path
-    suffix  = Path(file.filename or "receipt").suffix or ".pdf"
+    suffix  = _MIME_TO_SUFFIX[file.content_type]
 
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = Path(tmp.name)
+    # Stream to disk in 64 KB chunks — a 50 MB scan never sits fully in RAM
+    # and the event loop yields between chunks.
+    tmp_path = _pending_upload_path(layout, suffix)
+    with tmp_path.open("wb") as out:
+        while chunk := await file.read(1 << 16):
+            out.write(chunk)
 
-    try:
+    def _extract():
         # Pass db_path explicitly so FinanceAgent uses this exact layout.
         # layout_from_db_path in agent.py will re-derive the project folder
         # correctly from the path we resolved above.
-        agent  = FinanceAgent(db_path=db_path)
-        result = agent.process_receipt(tmp_path, receipt_type=receipt_type)
+        agent = FinanceAgent(db_path=db_path)
+        return agent.process_receipt(tmp_path, receipt_type=receipt_type)
+
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(
+            _agent_executor(), _extract
+        )
     finally:
         tmp_path.unlink(missing_ok=True)
 
@@ -648,63 +1003,187 @@ async def upload_receipt(
     return response
 
 
+# In-memory job store for fire-and-forget uploads.  Extraction takes seconds;
+# the background variant returns 202 immediately and the SPA polls the job.
+_JOBS_MAX = 100
+_jobs: dict[str, dict] = {}
+_jobs_lock = threading.Lock()
+
+
+def _store_job(job_id: str, payload: dict) -> None:
+    with _jobs_lock:
+        _jobs[job_id] = payload
+        # Evict oldest finished jobs so an unattended server can't grow
+        # the store without bound (dicts preserve insertion order).
+        while len(_jobs) > _JOBS_MAX:
+            for jid, job in _jobs.items():
+                if job["status"] != "pending":
+                    del _jobs[jid]
+                    break
+            else:
+                break
+
+
+@app.post("/receipts/upload/background", status_code=status.HTTP_202_ACCEPTED, tags=["receipts"])
+async def upload_receipt_background(
+    file:         Annotated[UploadFile, File(description="Receipt PDF or image")],
+    receipt_type: str           = Query(default="purchase", enum=["purchase", "sale"]),
+    db:           Optional[str] = Query(default=None, description="DB file path"),
+):
+    """Accept an upload, queue extraction and return a job id immediately.
+
+    Poll ``GET /receipts/jobs/{job_id}`` — ``status`` moves from ``pending``
+    to ``done`` (with the receipt payload) or ``error``.
+    """
+    if file.content_type not in ALLOWED_MIME_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported file type '{file.content_type}'.",
+        )
+    if not _LIB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="finamt library not installed.")
+
+    layout  = _resolve_layout(db)
+    db_path = layout.db_path
+    suffix  = _MIME_TO_SUFFIX[file.content_type]
+
+    tmp_path = _pending_upload_path(layout, suffix)
+    with tmp_path.open("wb") as out:
+        while chunk := await file.read(1 << 16):
+            out.write(chunk)
+
+    import uuid as _uuid
+    job_id = _uuid.uuid4().hex
+    _store_job(job_id, {"status": "pending"})
+
+    def _run() -> None:
+        try:
+            agent  = FinanceAgent(db_path=db_path)
+            result = agent.process_receipt(tmp_path, receipt_type=receipt_type)
+        except Exception as exc:
+            _store_job(job_id, {"status": "error", "detail": str(exc)})
+            return
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        if not result.success:
+            _store_job(job_id, {
+                "status": "error",
+                "detail": f"Extraction failed: {result.error_message}",
+            })
+            return
+        response = _receipt_to_response(result.data, db_path)
+        response["duplicate"] = result.duplicate
+        _store_job(job_id, {"status": "done", "receipt": response})
+
+    asyncio.get_running_loop().run_in_executor(_agent_executor(), _run)
+    return _DefaultResponse({"job_id": job_id, "status": "pending"},
+                            status_code=status.HTTP_202_ACCEPTED)
+
+
+@app.get("/receipts/jobs/{job_id}", tags=["receipts"])
+def get_upload_job(job_id: str):
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job id.")
+    return _DefaultResponse(job)
+
+
+# Hot read endpoints are async with the blocking SQLite/filesystem section
+# pushed to the threadpool explicitly: the event loop keeps accepting
+# connections and only the DB block occupies a worker thread, instead of the
+# whole handler pinning one for its full duration.
+
 @app.get("/receipts", tags=["receipts"])
-def list_receipts(
+async def list_receipts(
     receipt_type: Optional[str] = Query(default=None, alias="type", enum=["purchase", "sale"]),
     category:     Optional[str] = Query(default=None),
     quarter:      Optional[int] = Query(default=None, ge=1, le=4),
     year:         Optional[int] = Query(default=None, ge=2000, le=2100),
+    limit:        Optional[int] = Query(default=None, ge=1, le=500),
+    offset:       int           = Query(default=0, ge=0),
     db:           Optional[str] = Query(default=None),
 ):
     db_path = _resolve_db(db)
     if not db_path.exists():
         return {"receipts": [], "total": 0}
-    with _repo(db_path) as repo:
-        if quarter and year:
-            starts = {1: (1,1), 2: (4,1), 3: (7,1), 4: (10,1)}
-            ends   = {1: (3,31), 2: (6,30), 3: (9,30), 4: (12,31)}
-            ms, ds = starts[quarter]; me, de = ends[quarter]
-            receipts = list(repo.find_by_period(date(year,ms,ds), date(year,me,de)))
-        elif receipt_type:
-            receipts = list(repo.find_by_type(receipt_type))
-        elif category:
-            receipts = list(repo.find_by_category(category))
-        else:
-            receipts = list(repo.list_all())
+    start = end = None
+    if quarter and year:
+        start, end = _quarter_bounds(year, quarter)
 
-    if receipt_type:
-        receipts = [r for r in receipts if str(r.receipt_type) == receipt_type]
-    if category:
-        receipts = [r for r in receipts if str(r.category) == category]
+    def _work() -> dict:
+        with _repo(db_path) as repo:
+            receipts = list(repo.find(
+                receipt_type=receipt_type, category=category, start=start, end=end,
+                limit=limit, offset=offset,
+            ))
+            # total reflects the filtered set, not the page; only worth a
+            # COUNT when the client actually paginates.
+            if limit is not None:
+                total = repo.count_matching(
+                    receipt_type=receipt_type, category=category, start=start, end=end,
+                )
+            else:
+                total = len(receipts)
+        pdf_ids = _existing_pdf_ids(db_path)
+        return {
+            "receipts": [_receipt_to_response(r, db_path, pdf_ids) for r in receipts],
+            "total":    total,
+        }
 
-    return {
-        "receipts": [_receipt_to_response(r, db_path) for r in receipts],
-        "total":    len(receipts),
-    }
+    # Return a Response directly: the payload is already JSON-primitive, so
+    # skipping FastAPI's jsonable_encoder walk over every receipt dict saves
+    # the dominant cost of large list responses.
+    return _DefaultResponse(await run_in_threadpool(_work))
 
 
 @app.get("/receipts/{receipt_id}", tags=["receipts"])
-def get_receipt(receipt_id: str, db: Optional[str] = Query(default=None)):
+async def get_receipt(receipt_id: str, db: Optional[str] = Query(default=None)):
     db_path = _resolve_db(db)
     _require_db(db_path)
-    with _repo(db_path) as repo:
-        receipt = repo.get(receipt_id)
+
+    def _work():
+        with _repo(db_path) as repo:
+            return repo.get(receipt_id)
+
+    receipt = await run_in_threadpool(_work)
     if not receipt:
         raise HTTPException(status_code=404, detail="Receipt not found.")
-    return _receipt_to_response(receipt, db_path)
+    return _DefaultResponse(_receipt_to_response(receipt, db_path))
 
 
 @app.get("/receipts/{receipt_id}/pdf", tags=["receipts"])
-def get_receipt_pdf(receipt_id: str, db: Optional[str] = Query(default=None)):
+def get_receipt_pdf(receipt_id: str, request: Request, db: Optional[str] = Query(default=None)):
     db_path = _resolve_db(db)
     stored  = _find_stored_file(receipt_id, db_path)
     if not stored:
         raise HTTPException(status_code=404, detail="File not found.")
+    # Receipt ids are content hashes, so the stored file is immutable — a
+    # matching ETag means the client's copy is current and we skip the read.
+    etag = f'"{receipt_id}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    st = stored.stat()
+    last_modified = formatdate(st.st_mtime, usegmt=True)
+    if request.headers.get("if-modified-since") == last_modified:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Last-Modified": last_modified},
+        )
     mime = _EXT_MIME.get(stored.suffix.lower(), "application/octet-stream")
     return FileResponse(
         path=stored,
+        # Hand over the stat we already took: Starlette then skips its own
+        # stat and streams straight from the open fd (sendfile where the
+        # server supports it).
+        stat_result=st,
         media_type=mime,
-        headers={"Content-Disposition": "inline"},
+        headers={
+            "Content-Disposition": "inline",
+            "ETag": etag,
+            "Last-Modified": last_modified,
+            "Cache-Control": "public, max-age=31536000, immutable",
+        },
     )
 
 
@@ -720,7 +1199,7 @@ def update_receipt(
         if not updated:
             raise HTTPException(status_code=404, detail="Receipt not found.")
         receipt = repo.get(receipt_id)
-    return _receipt_to_response(receipt, db_path)
+    return _DefaultResponse(_receipt_to_response(receipt, db_path))
 
 
 @app.delete("/receipts/{receipt_id}", status_code=204, tags=["receipts"])
@@ -755,7 +1234,7 @@ def reassign_receipt_counterparty(
         if not repo.relink_counterparty(receipt_id, flat):
             raise HTTPException(status_code=404, detail="Receipt not found.")
         receipt = repo.get(receipt_id)
-    return _receipt_to_response(receipt, db_path)
+    return _DefaultResponse(_receipt_to_response(receipt, db_path))
 
 
 # ---------------------------------------------------------------------------
@@ -770,7 +1249,8 @@ def list_all_counterparties(db: Optional[str] = Query(default=None)):
         return {"counterparties": []}
     with _repo(db_path) as repo:
         rows = repo.list_all_counterparties()
-    return {"counterparties": rows}
+    # Rows are already JSON primitives — skip the jsonable_encoder pass.
+    return _DefaultResponse({"counterparties": rows})
 
 
 @app.get("/counterparties/verified", tags=["counterparties"])
@@ -781,7 +1261,7 @@ def list_verified_counterparties(db: Optional[str] = Query(default=None)):
         return {"counterparties": []}
     with _repo(db_path) as repo:
         rows = repo.list_verified_counterparties()
-    return {"counterparties": rows}
+    return _DefaultResponse({"counterparties": rows})
 
 
 @app.get("/counterparties/{cp_id}/defaults", tags=["counterparties"])
@@ -843,23 +1323,28 @@ def set_counterparty_verified(
 
 
 @app.get("/tax/ustva", tags=["tax"])
-def get_ustva(
+async def get_ustva(
     quarter: int           = Query(..., ge=1, le=4),
     year:    int           = Query(..., ge=2000, le=2100),
     db:      Optional[str] = Query(default=None),
 ):
     db_path = _resolve_db(db)
-    starts  = {1:(1,1),2:(4,1),3:(7,1),4:(10,1)}
-    ends    = {1:(3,31),2:(6,30),3:(9,30),4:(12,31)}
-    ms, ds  = starts[quarter]; me, de = ends[quarter]
-    start, end = date(year,ms,ds), date(year,me,de)
+    start, end = _quarter_bounds(year, quarter)
 
     if not db_path.exists():
         return generate_ustva([], start, end).to_dict()
-    with _repo(db_path) as repo:
-        receipts = list(repo.find_by_period(start, end))
 
-    return generate_ustva(receipts, start, end).to_dict()
+    def _work() -> dict:
+        with _repo(db_path) as repo:
+            # Fast path for the common "no data in this quarter yet" case —
+            # one LIMIT 1 probe instead of hydrating receipts.
+            if not repo.has_any_in_period(start, end):
+                return generate_ustva([], start, end).to_dict()
+            receipts = list(repo.find_for_ustva(start, end))
+        return generate_ustva(receipts, start, end).to_dict()
+
+    # to_dict() emits only str/int values, safe to serialize directly.
+    return _DefaultResponse(await run_in_threadpool(_work))
 
 
 # ---------------------------------------------------------------------------
@@ -945,17 +1430,66 @@ def post_ebilanz_xbrl(
 
 STATIC_DIR = Path(__file__).parent / "static"
 
-if STATIC_DIR.exists() and any(STATIC_DIR.iterdir()):
-    assets_dir = STATIC_DIR / "assets"
-    if assets_dir.exists():
-        app.mount("/assets", StaticFiles(directory=assets_dir), name="assets")
+_assets_dir = STATIC_DIR / "assets"
+if _assets_dir.is_dir():
+    app.mount("/assets", StaticFiles(directory=_assets_dir), name="assets")
 
-    @app.get("/{full_path:path}", include_in_schema=False)
-    async def serve_spa(full_path: str):
-        file_path = STATIC_DIR / full_path
-        if file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(STATIC_DIR / "index.html")
+class SPAStaticFiles(StaticFiles):
+    """StaticFiles with an index.html fallback for client-side routes.
+
+    Small files (index.html, icons, JS chunks) are additionally cached in
+    memory after the first hit with a content-hash ETag, so SPA navigations
+    are served without any disk I/O and revalidations collapse to a 304.
+    Large assets keep Starlette's native sender (range requests etc.); the
+    bundle is immutable between restarts, so the cache never goes stale.
+    """
+
+    _CACHE_FILE_MAX = 256 * 1024  # bytes
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._cache: dict[str, tuple[bytes, str, str]] = {}
+
+    async def get_response(self, path: str, scope):
+        cached = self._cache.get(path)
+        if cached is None:
+            try:
+                response = await super().get_response(path, scope)
+            except StarletteHTTPException as exc:
+                if exc.status_code != 404 or path == "index.html":
+                    raise
+                return await self.get_response("index.html", scope)
+            if response.status_code == 404 and path != "index.html":
+                return await self.get_response("index.html", scope)
+            file_path = getattr(response, "path", None)
+            st = getattr(response, "stat_result", None)
+            if not (
+                response.status_code == 200
+                and file_path
+                and st is not None
+                and st.st_size <= self._CACHE_FILE_MAX
+            ):
+                return response
+            import hashlib
+            data = Path(file_path).read_bytes()
+            etag = f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+            cached = (data, etag, response.media_type or "application/octet-stream")
+            self._cache[path] = cached
+
+        data, etag, media_type = cached
+        headers = Headers(scope=scope)
+        if etag in (headers.get("if-none-match") or ""):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                            headers={"ETag": etag})
+        return Response(
+            content=data,
+            media_type=media_type,
+            headers={"ETag": etag, "Cache-Control": "public, max-age=3600"},
+        )
+
+
+if STATIC_DIR.is_dir():
+    app.mount("/", SPAStaticFiles(directory=STATIC_DIR, html=True), name="spa")
 else:
     @app.get("/{full_path:path}", include_in_schema=False)
     async def spa_not_built(full_path: str):
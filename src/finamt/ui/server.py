@@ -27,10 +27,8 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
-import threading
-import time
-import webbrowser
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -41,21 +39,13 @@ DEFAULT_PORT = 8000
 STATIC_DIR = Path(__file__).parent / "static"
 
 
-def _open_browser(url: str, delay: float = 1.2) -> None:
-    """Open the browser after a short delay so the server is ready."""
-    def _open():
-        time.sleep(delay)
-        webbrowser.open(url)
-    t = threading.Thread(target=_open, daemon=True)
-    t.start()
-
-
 def launch(
     host: str = DEFAULT_HOST,
     port: int = DEFAULT_PORT,
     reload: bool = False,
     open_browser: bool = True,
     log_level: str = "warning",
+    workers: int = 1,
 ) -> None:
     """
     Start the finamt API + UI server.
@@ -66,6 +56,10 @@ def launch(
         reload:       Enable uvicorn hot-reload (dev mode only).
         open_browser: Automatically open the browser on start.
         log_level:    Uvicorn log level.
+        workers:      Worker process count (ignored with --reload).  The
+                      background-upload job store is per-process, so job
+                      polling across workers is unreliable; the browser
+                      auto-open is suppressed to avoid one tab per worker.
     """
     try:
         import uvicorn
@@ -95,8 +89,52 @@ def launch(
     print(f"  API docs      →  {url}/docs")
     print(f"  Press Ctrl+C to stop.\n")
 
-    if open_browser:
-        _open_browser(url)
+    multi_worker = not reload and workers > 1
+    if multi_worker:
+        # Background-upload job ids (POST /receipts/upload/background) live
+        # in a per-process store, so polling only works on the worker that
+        # accepted the upload.  Keep the endpoint usable by warning loudly;
+        # the synchronous and SSE upload paths are unaffected.
+        print(
+            "  ⚠  --workers > 1: background upload job polling is\n"
+            "     per-worker and may return 404 from other workers.\n"
+            "     Use the synchronous or streaming upload endpoints."
+        )
+
+    if open_browser and not multi_worker:
+        if reload:
+            # The reloader respawns the worker on every source change and
+            # each respawn inherits the supervisor's env, so the startup
+            # hook would open a fresh tab per change.  Open exactly once
+            # from this (supervisor) process instead.
+            import threading
+            import webbrowser
+            threading.Timer(1.0, webbrowser.open, args=(url,)).start()
+        else:
+            # The app process opens the browser from a startup hook (see
+            # api.py) once it is actually serving.  Skipped in multi-worker
+            # mode: every worker inherits the env and each would open its
+            # own tab.
+            os.environ["FINAMT_OPEN_BROWSER"] = "1"
+            os.environ["FINAMT_URL"] = url
+
+    # Prefer the C-accelerated event loop / HTTP parser when available
+    # (bundled with uvicorn[standard]); fall back to stdlib otherwise.
+    extra = {}
+    try:
+        import uvloop  # noqa: F401
+        extra["loop"] = "uvloop"
+    except ImportError:
+        pass
+    try:
+        import httptools  # noqa: F401
+        extra["http"] = "httptools"
+    except ImportError:
+        pass
+    # uvicorn rejects workers together with reload; multi-worker mode is
+    # for production-style serving on multi-core hosts.
+    if multi_worker:
+        extra["workers"] = workers
 
     uvicorn.run(
         "finamt.ui.api:app",
@@ -104,6 +142,7 @@ def launch(
         port=port,
         reload=reload,
         log_level=log_level,
+        **extra,
     )
 
 
@@ -127,6 +166,9 @@ def _build_parser() -> argparse.ArgumentParser:
     p.add_argument("--log-level",  default="warning",
                    choices=["debug", "info", "warning", "error"],
                    help="Uvicorn log level.")
+    p.add_argument("--workers",    default=1, type=int,
+                   help="Worker processes (ignored with --reload; "
+                        "background upload job polling is per-worker).")
     return p
 
 
@@ -148,6 +190,7 @@ def main() -> None:
         reload=args.reload,
         open_browser=not args.no_browser,
         log_level=args.log_level,
+        workers=args.workers,
     )
 
 
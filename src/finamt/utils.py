@@ -43,8 +43,22 @@ _CATEGORY_KEYWORDS: Dict[str, List[str]] = {
     "public_fees":       ["rundfunkbeitrag", "ard", "zdf", "gez", "ihk", "hwk", "berufsgenossenschaft", "pflichtbeitrag", "kammerbeitrag"],
 }
 
+# Flattened keyword → category map plus one alternation over all keywords,
+# longest first so e.g. "druckerpapier" (material) wins over "drucker"
+# (equipment). One C-level scan per description instead of a Python `in`
+# check per keyword.
+_KW_TO_CAT: Dict[str, str] = {
+    kw: category
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+    for kw in keywords
+}
+_CATEGORY_RE = re.compile(
+    "|".join(sorted(map(re.escape, _KW_TO_CAT), key=len, reverse=True))
+)
+
 # Keywords that anchor a line as the grand total (checked before max() fallback)
 _TOTAL_KEYWORDS = ["gesamt", "gesamtbetrag", "total", "summe", "endbetrag", "brutto", "rechnungsbetrag"]
+_TOTAL_RE = re.compile("|".join(map(re.escape, _TOTAL_KEYWORDS)), re.IGNORECASE)
 
 # German month names → month number
 _MONTH_MAP: Dict[str, int] = {
@@ -61,59 +75,109 @@ _MONTH_MAP: Dict[str, int] = {
     "november": 11,
     "dezember": 12, "december": 12,
 }
-
-# Date regexes in (pattern, order) pairs.
-# order: "dmy" | "ymd" so the unpacking is unambiguous.
-_DATE_PATTERNS: List[tuple[str, str]] = [
-    (r'\b(\d{1,2})\.(\d{1,2})\.(\d{4})\b',        "dmy"),  # DD.MM.YYYY
-    (r'\b(\d{1,2})\.(\d{1,2})\.(\d{2})\b',         "dmy"),  # DD.MM.YY
-    (r'\b(\d{4})-(\d{2})-(\d{2})\b',               "ymd"),  # YYYY-MM-DD  ← fixed order
-    (r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b',           "dmy"),  # DD/MM/YYYY
-    (r'\b(\d{1,2})\s+([A-Za-zÄÖÜäöü]+)\s+(\d{4})\b', "dmy"),  # 12 Januar 2023
-]
-
-# Amount regexes — German locale (period = thousands sep, comma = decimal)
-_AMOUNT_PATTERNS = [
-    r'(\d{1,3}(?:\.\d{3})*,\d{2})\s*€',
-    r'€\s*(\d{1,3}(?:\.\d{3})*,\d{2})',
-    r'EUR\s*(\d{1,3}(?:\.\d{3})*,\d{2})',
-    r'(\d{1,3}(?:\.\d{3})*,\d{2})\s*EUR',
+# Numeric month tokens ('3', '03') resolve through the same map so
+# extract_date needs no isdigit branch per match.
+_MONTH_MAP.update({str(i): i for i in range(1, 13)})
+_MONTH_MAP.update({f"{i:02d}": i for i in range(1, 13)})
+
+# All patterns below are compiled once at import — the extract_* methods run
+# per OCR'd line, and re-resolving patterns through re's internal cache on
+# every call adds measurable overhead on item-heavy receipts.
+
+# Date regexes in (pattern, group permutation) pairs.  The permutation
+# maps capture groups to (day, month, year) positions so the loop indexes
+# instead of branching on a format tag per match.
+_DMY = (0, 1, 2)
+_YMD = (2, 1, 0)
+_DATE_PATTERNS: List[tuple[re.Pattern[str], tuple[int, int, int]]] = [
+    (re.compile(p), perm)
+    for p, perm in [
+        (r'\b(\d{1,2})\.(\d{1,2})\.(\d{4})\b',        _DMY),  # DD.MM.YYYY
+        (r'\b(\d{1,2})\.(\d{1,2})\.(\d{2})\b',         _DMY),  # DD.MM.YY
+        (r'\b(\d{4})-(\d{2})-(\d{2})\b',               _YMD),  # YYYY-MM-DD  ← fixed order
+        (r'\b(\d{1,2})/(\d{1,2})/(\d{4})\b',           _DMY),  # DD/MM/YYYY
+        (r'\b(\d{1,2})\s+([A-Za-zÄÖÜäöü]+)\s+(\d{4})\b', _DMY),  # 12 Januar 2023
+    ]
 ]
 
-# VAT line regexes
-_VAT_PATTERNS = [
-    r'(\d{1,2}(?:,\d{1,2})?)\s*%.*?(\d{1,3}(?:\.\d{3})*,\d{2})\s*€',
-    r'MwSt\.?\s*(\d{1,2}(?:,\d{1,2})?)\s*%.*?(\d{1,3}(?:\.\d{3})*,\d{2})',
-    r'VAT\s*(\d{1,2}(?:,\d{1,2})?)\s*%.*?(\d{1,3}(?:\.\d{3})*,\d{2})',
+# Amount regex — German locale (period = thousands sep, comma = decimal).
+# One alternation covers currency marker before or after the number, so a
+# document is scanned once instead of once per marker position.
+_AMOUNT_RE = re.compile(
+    r'(?:€|EUR)\s*(\d{1,3}(?:\.\d{3})*,\d{2})'
+    r'|(\d{1,3}(?:\.\d{3})*,\d{2})\s*(?:€|EUR)'
+)
+
+# VAT line regexes (case-insensitive: MwSt/mwst, VAT/vat)
+_VAT_PATTERNS: List[re.Pattern[str]] = [
+    re.compile(p, re.IGNORECASE)
+    for p in [
+        r'(\d{1,2}(?:,\d{1,2})?)\s*%.*?(\d{1,3}(?:\.\d{3})*,\d{2})\s*€',
+        r'MwSt\.?\s*(\d{1,2}(?:,\d{1,2})?)\s*%.*?(\d{1,3}(?:\.\d{3})*,\d{2})',
+        r'VAT\s*(\d{1,2}(?:,\d{1,2})?)\s*%.*?(\d{1,3}(?:\.\d{3})*,\d{2})',
+    ]
 ]
 
 # Item line regexes — ordered most-specific first so the quantity×price
 # pattern is tried before the generic description+price fallback.
-_ITEM_PATTERNS = [
-    r'^(\d+(?:,\d+)?)\s*[xX]\s*(.+?)\s+(\d{1,3}(?:\.\d{3})*,\d{2})\s*€?\s*$',
-    r'^(.+?)\s*@\s*(\d{1,3}(?:\.\d{3})*,\d{2})\s*=\s*(\d{1,3}(?:\.\d{3})*,\d{2})\s*€?\s*$',
-    r'^(.+?)\s+(\d{1,3}(?:\.\d{3})*,\d{2})\s*€?\s*$',
+_ITEM_PATTERNS: List[re.Pattern[str]] = [
+    re.compile(p)
+    for p in [
+        r'^(\d+(?:,\d+)?)\s*[xX]\s*(.+?)\s+(\d{1,3}(?:\.\d{3})*,\d{2})\s*€?\s*$',
+        r'^(.+?)\s*@\s*(\d{1,3}(?:\.\d{3})*,\d{2})\s*=\s*(\d{1,3}(?:\.\d{3})*,\d{2})\s*€?\s*$',
+        r'^(.+?)\s+(\d{1,3}(?:\.\d{3})*,\d{2})\s*€?\s*$',
+    ]
 ]
 
+# clean_json_response regexes + reusable decoder for the happy path
+_JSON_DECODER      = json.JSONDecoder()
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_JSON_OBJ_RE       = re.compile(r"\{.*\}", re.DOTALL)
+_UNQUOTED_KEY_RE   = re.compile(r'([{,]\s*)([A-Za-z_]\w*)\s*:')
+
 # Lines that look like receipt boilerplate rather than company names
 _SKIP_HEADER_WORDS = frozenset([
     "receipt", "rechnung", "kassenbon", "beleg", "quittung",
     "datum", "uhrzeit", "kasse", "bon",
 ])
+_SKIP_HEADER_RE = re.compile(
+    "|".join(map(re.escape, sorted(_SKIP_HEADER_WORDS))), re.IGNORECASE
+)
 
 
 # ---------------------------------------------------------------------------
 # Helper: German amount string → Decimal
 # ---------------------------------------------------------------------------
 
+# Drop thousands separators and turn the decimal comma into a period in a
+# single translate pass (two chained .replace calls allocate twice).
+_AMOUNT_TRANS = str.maketrans({".": "", ",": "."})
+
+
 def _parse_german_amount(s: str) -> Optional[Decimal]:
     """Convert a German-format amount string (e.g. '1.234,56') to Decimal."""
     try:
-        return Decimal(s.replace(".", "").replace(",", "."))
+        return Decimal(s.translate(_AMOUNT_TRANS))
     except (InvalidOperation, ValueError):
         return None
 
 
+def _parse_german_cents(s: str) -> Optional[int]:
+    """
+    Convert a German-format amount string to integer cents.
+
+    The regexes guarantee exactly two decimal places, so dropping the
+    separators yields the cent value directly.  Used in the extraction
+    inner loops where plain ``int`` arithmetic beats ``Decimal``
+    construction per match; callers convert back at the boundary via
+    ``Decimal(cents).scaleb(-2)``.
+    """
+    try:
+        return int(s.replace(".", "").replace(",", ""))
+    except ValueError:
+        return None
+
+
 # ---------------------------------------------------------------------------
 # DataExtractor
 # ---------------------------------------------------------------------------
@@ -125,6 +189,33 @@ class DataExtractor:
     All methods are static — instantiate the class or call methods directly.
     """
 
+    # ------------------------------------------------------------------
+    # Combined extraction
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def extract_all(text: str) -> Dict[str, Any]:
+        """
+        Run every extractor over the same text in one call.
+
+        Splits the text into lines once and shares the result with the
+        line-oriented extractors, instead of each method re-splitting the
+        full OCR body.
+
+        Returns ``{"company_name", "date", "amounts", "vat", "items"}``
+        with the same values the individual methods would produce.
+        """
+        # split('\n') rather than splitlines(): OCR output is '\n'-joined
+        # upstream, and split skips the Unicode line-boundary scan.
+        lines = text.split("\n")
+        return {
+            "company_name": DataExtractor._company_from_lines(lines),
+            "date":         DataExtractor.extract_date(text),
+            "amounts":      DataExtractor.extract_amounts(text),
+            "vat":          DataExtractor.extract_vat_info(text),
+            "items":        DataExtractor._items_from_lines(lines),
+        }
+
     # ------------------------------------------------------------------
     # Company / vendor
     # ------------------------------------------------------------------
@@ -137,15 +228,19 @@ class DataExtractor:
         Skips blank lines, lines that start with a digit (dates, amounts),
         and lines containing common boilerplate words.
         """
-        for line in text.splitlines()[:8]:
+        return DataExtractor._company_from_lines(text.split("\n"))
+
+    @staticmethod
+    def _company_from_lines(lines: List[str]) -> Optional[str]:
+        for line in lines[:8]:
             line = line.strip()
             if not line:
                 continue
-            if re.match(r"^\d", line):
+            if line[:1].isdigit():
                 continue
             if len(line) < 3:
                 continue
-            if any(w in line.lower() for w in _SKIP_HEADER_WORDS):
+            if _SKIP_HEADER_RE.search(line):
                 continue
             return line
         return None
@@ -162,14 +257,10 @@ class DataExtractor:
         Handles DD.MM.YYYY, YYYY-MM-DD, DD/MM/YYYY and German month names.
         Two-digit years are interpreted as 2000+ if < 50, else 1900+.
         """
-        for pattern, order in _DATE_PATTERNS:
-            for groups in re.findall(pattern, text):
+        for pattern, (di, mi, yi) in _DATE_PATTERNS:
+            for groups in pattern.findall(text):
                 try:
-                    a, b, c = groups
-                    if order == "ymd":
-                        year, month_raw, day = a, b, c
-                    else:
-                        day, month_raw, year = a, b, c
+                    day, month_raw, year = groups[di], groups[mi], groups[yi]
 
                     # Resolve year
                     year = int(year)
@@ -177,12 +268,9 @@ class DataExtractor:
                         year = 2000 + year if year < 50 else 1900 + year
 
                     # Resolve month (numeric or German/English name)
-                    if month_raw.isdigit():
-                        month = int(month_raw)
-                    else:
-                        month = _MONTH_MAP.get(month_raw.lower())
-                        if month is None:
-                            continue
+                    month = _MONTH_MAP.get(month_raw) or _MONTH_MAP.get(month_raw.lower())
+                    if month is None:
+                        continue
 
                     return datetime(year, month, int(day))
                 except (ValueError, TypeError):
@@ -194,38 +282,51 @@ class DataExtractor:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def extract_amounts(text: str) -> Dict[str, Any]:
+    def extract_amounts(text: str, total_only: bool = False) -> Dict[str, Any]:
         """
         Extract monetary amounts from text.
 
         Strategy:
-        1. Scan lines that contain a total-indicating keyword; use the
-           amount on that line as the grand total.
+        1. Prefer an amount on a line containing a total-indicating keyword.
         2. Fall back to the largest amount found in the document.
 
-        Returns ``{"total": Decimal | None, "all": [Decimal, ...]}``.
-        """
-        all_amounts: List[Decimal] = []
-        total_amount: Optional[Decimal] = None
-
-        for line in text.splitlines():
-            line_lower = line.lower()
-            is_total_line = any(kw in line_lower for kw in _TOTAL_KEYWORDS)
+        With ``total_only=True`` the scan stops at the first keyword-anchored
+        total instead of collecting every amount in the document.
 
-            for pattern in _AMOUNT_PATTERNS:
-                for match in re.findall(pattern, line):
-                    amount = _parse_german_amount(match)
-                    if amount is None:
-                        continue
-                    all_amounts.append(amount)
-                    # Prefer a total-keyword-anchored amount
-                    if is_total_line and total_amount is None:
-                        total_amount = amount
+        Returns ``{"total": Decimal | None, "all": [Decimal, ...]}``.
 
-        if total_amount is None and all_amounts:
-            total_amount = max(all_amounts)  # last-resort fallback
+        The document is scanned in a single ``finditer`` pass; the
+        surrounding line (for the total-keyword check) is sliced out via
+        newline offsets rather than splitting the whole text into lines.
+        """
+        all_cents: List[int] = []
+        total_cents: Optional[int] = None
 
-        return {"total": total_amount, "all": all_amounts}
+        for m in _AMOUNT_RE.finditer(text):
+            cents = _parse_german_cents(m.group(1) or m.group(2))
+            if cents is None:
+                continue
+            all_cents.append(cents)
+
+            # Prefer a total-keyword-anchored amount
+            if total_cents is None:
+                line_start = text.rfind("\n", 0, m.start()) + 1
+                line_end = text.find("\n", m.end())
+                if line_end == -1:
+                    line_end = len(text)
+                if _TOTAL_RE.search(text, line_start, line_end):
+                    total_cents = cents
+                    if total_only:
+                        total = Decimal(total_cents).scaleb(-2)
+                        return {"total": total, "all": [total]}
+
+        if total_cents is None and all_cents:
+            total_cents = max(all_cents)  # last-resort fallback
+
+        return {
+            "total": Decimal(total_cents).scaleb(-2) if total_cents is not None else None,
+            "all":   [Decimal(c).scaleb(-2) for c in all_cents],
+        }
 
     # ------------------------------------------------------------------
     # VAT
@@ -235,7 +336,7 @@ class DataExtractor:
     def extract_vat_info(text: str) -> Dict[str, Optional[Decimal]]:
         """Extract the first VAT percentage + absolute amount found."""
         for pattern in _VAT_PATTERNS:
-            for match in re.findall(pattern, text, re.IGNORECASE):
+            for match in pattern.findall(text):
                 try:
                     vat_pct = Decimal(match[0].replace(",", "."))
                     vat_amt = _parse_german_amount(match[1])
@@ -257,48 +358,60 @@ class DataExtractor:
         Returns a list of dicts with keys matching the LLM extraction
         schema so both paths feed ``_build_receipt_data`` identically.
         """
+        return DataExtractor._items_from_lines(text.split("\n"))
+
+    @staticmethod
+    def _items_from_lines(lines: List[str]) -> List[Dict[str, Any]]:
         items: List[Dict[str, Any]] = []
 
-        for line in text.splitlines():
+        for line in lines:
             line = line.strip()
             if not line:
                 continue
+            # Cheap prefilter: every item pattern requires a German decimal
+            # price (",dd") and ends on the price digits or a € sign, so most
+            # header/address lines never reach the regex engine.
+            if "," not in line:
+                continue
+            if not line[-1].isdigit() and line[-1] != "€":
+                continue
 
             for pattern in _ITEM_PATTERNS:
-                m = re.match(pattern, line)
+                m = pattern.match(line)
                 if not m:
                     continue
                 groups = m.groups()
 
                 if len(groups) == 2:                    # description + price
                     description = groups[0].strip()
-                    total_price = _parse_german_amount(groups[1])
-                    if total_price is None:
+                    cents = _parse_german_cents(groups[1])
+                    if cents is None:
                         continue
                     items.append({
                         "description": description,
                         "quantity":    None,
                         "unit_price":  None,
-                        "total_price": float(total_price),
+                        "total_price": cents / 100.0,
                         "category":    DataExtractor._categorize_item(description),
                         "vat_rate":    None,
                     })
 
                 elif len(groups) == 3:                  # qty × description = price
                     try:
-                        qty = Decimal(groups[0].replace(",", "."))
-                    except InvalidOperation:
+                        qty = float(groups[0].replace(",", "."))
+                    except ValueError:
                         continue
                     description = groups[1].strip()
-                    total_price = _parse_german_amount(groups[2])
-                    if total_price is None:
+                    cents = _parse_german_cents(groups[2])
+                    if cents is None:
                         continue
+                    total_price = cents / 100.0
                     unit_price = total_price / qty if qty > 0 else None
                     items.append({
                         "description": description,
-                        "quantity":    float(qty),
-                        "unit_price":  float(unit_price) if unit_price else None,
-                        "total_price": float(total_price),
+                        "quantity":    qty,
+                        "unit_price":  unit_price if unit_price else None,
+                        "total_price": total_price,
                         "category":    DataExtractor._categorize_item(description),
                         "vat_rate":    None,
                     })
@@ -314,11 +427,8 @@ class DataExtractor:
 
         Returns a string that is always a valid ``ReceiptCategory`` value.
         """
-        lower = description.lower()
-        for category, keywords in _CATEGORY_KEYWORDS.items():
-            if any(kw in lower for kw in keywords):
-                return category
-        return "other"
+        m = _CATEGORY_RE.search(description.lower())
+        return _KW_TO_CAT[m.group(0)] if m else "other"
 
 
 # ---------------------------------------------------------------------------
@@ -338,38 +448,51 @@ def clean_json_response(response: str) -> str:
     Returns an empty JSON object ``{}`` on total failure so callers can
     always call ``json.loads()`` on the result.
     """
-    # Strip markdown fences
-    response = re.sub(r"```(?:json)?\s*", "", response)
-    response = re.sub(r"```\s*$", "", response, flags=re.MULTILINE)
+    # Strip markdown fences — only ever at the string boundaries, so plain
+    # prefix/suffix removal beats two regex passes over the whole response.
     response = response.strip()
+    if response.startswith("```"):
+        response = response.removeprefix("```json").removeprefix("```").lstrip()
+    if response.endswith("```"):
+        response = response.removesuffix("```").rstrip()
+
+    start = response.find("{")
+    if start < 0:
+        logger.warning("No JSON object found in LLM response.")
+        return "{}"
 
-    # Remove trailing commas before } or ]
-    response = re.sub(r",\s*([}\]])", r"\1", response)
+    # Happy path: raw_decode finds the object's extent in C and validates it
+    # in one shot — no regex touches the response, so URLs and colons inside
+    # string values can't be corrupted.
+    try:
+        _, end = _JSON_DECODER.raw_decode(response, start)
+        return response[start:end]
+    except json.JSONDecodeError:
+        pass
 
-    # Extract the outermost JSON object
-    match = re.search(r"\{.*\}", response, re.DOTALL)
+    # Only reach here when the JSON is actually malformed.
+    # Remove trailing commas before } or ], then re-extract the outermost
+    # object (the greedy DOTALL search tolerates braces in trailing prose).
+    response = _TRAILING_COMMA_RE.sub(r"\1", response)
+    match = _JSON_OBJ_RE.search(response)
     if not match:
         logger.warning("No JSON object found in LLM response.")
         return "{}"
 
     candidate = match.group(0)
 
-    # Try to parse as-is first — if it's already valid JSON, return immediately.
-    # This prevents any regex from corrupting URLs or colons inside string values.
     try:
         json.loads(candidate)
         return candidate
     except json.JSONDecodeError:
         pass
 
-    # Only reach here when the JSON is actually malformed.
-    # Attempt to quote unquoted object keys.
+    # Last resort: attempt to quote unquoted object keys.
     # Pattern matches a word that is:
     #   - preceded by { or , (with optional whitespace) — i.e. in key position
     #   - not already quoted
     #   - followed by optional whitespace and a colon
-    fixed = re.sub(
-        r'([{,]\s*)([A-Za-z_]\w*)\s*:',
+    fixed = _UNQUOTED_KEY_RE.sub(
         lambda m: f'{m.group(1)}"{m.group(2)}":',
         candidate,
     )
@@ -390,6 +513,11 @@ def parse_decimal(value: Any) -> Optional[Decimal]:
     """Safely coerce any value to ``Decimal``, returning ``None`` on failure."""
     if value is None:
         return None
+    # Decimal and int need no round-trip through str
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return Decimal(value)
     try:
         return Decimal(str(value))
     except (InvalidOperation, ValueError):
@@ -427,8 +555,18 @@ def parse_date(date_str: str) -> Optional[datetime]:
     if not date_str:
         return None
 
-    candidates = [date_str.strip()]
-    normalised = _normalise_date_str(date_str.strip())
+    date_str = date_str.strip()
+
+    # Fast path: YYYY-MM-DD is the documented primary format, and
+    # fromisoformat parses it in C without strptime's format machinery.
+    if len(date_str) == 10 and date_str[4] == "-":
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+
+    candidates = [date_str]
+    normalised = _normalise_date_str(date_str)
     if normalised != candidates[0]:
         candidates.append(normalised)
 
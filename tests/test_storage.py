@@ -419,6 +419,143 @@ class TestFindByType:
         assert len(result) == 1
 
 
+# ---------------------------------------------------------------------------
+# find / count_matching — combined filters + paging (backs GET /receipts)
+# ---------------------------------------------------------------------------
+
+class TestFindCombined:
+    @pytest.fixture
+    def filled_repo(self, repo):
+        repo.save(_make_receipt(
+            counterparty=_make_counterparty("P Soft Q1"),
+            receipt_type="purchase", category="software",
+            receipt_date=datetime(2024, 2, 1),
+        ))
+        repo.save(_make_receipt(
+            counterparty=_make_counterparty("P Travel Q1"),
+            receipt_type="purchase", category="travel",
+            receipt_date=datetime(2024, 3, 1),
+        ))
+        repo.save(_make_receipt(
+            counterparty=_make_counterparty("S Soft Q2"),
+            receipt_type="sale", category="software",
+            receipt_date=datetime(2024, 5, 1),
+        ))
+        repo.save(_make_receipt(
+            counterparty=_make_counterparty("P Soft Q2"),
+            receipt_type="purchase", category="software",
+            receipt_date=datetime(2024, 6, 1),
+        ))
+        return repo
+
+    def test_no_filters_returns_all(self, filled_repo):
+        assert len(list(filled_repo.find())) == 4
+
+    def test_single_type_filter(self, filled_repo):
+        result = list(filled_repo.find(receipt_type="purchase"))
+        assert len(result) == 3
+        assert all(str(r.receipt_type) == "purchase" for r in result)
+
+    def test_type_and_category(self, filled_repo):
+        result = list(filled_repo.find(receipt_type="purchase", category="software"))
+        assert len(result) == 2
+
+    def test_type_category_and_period(self, filled_repo):
+        result = list(filled_repo.find(
+            receipt_type="purchase", category="software",
+            start=date(2024, 1, 1), end=date(2024, 3, 31),
+        ))
+        assert len(result) == 1
+        assert result[0].receipt_date == datetime(2024, 2, 1)
+
+    def test_ordered_date_descending(self, filled_repo):
+        dates = [r.receipt_date for r in filled_repo.find()]
+        assert dates == sorted(dates, reverse=True)
+
+    def test_limit_pages_result(self, filled_repo):
+        page = list(filled_repo.find(limit=2))
+        assert len(page) == 2
+        assert page[0].receipt_date == datetime(2024, 6, 1)
+
+    def test_offset_skips_rows(self, filled_repo):
+        page1 = list(filled_repo.find(limit=2, offset=0))
+        page2 = list(filled_repo.find(limit=2, offset=2))
+        assert len(page2) == 2
+        assert {r.id for r in page1}.isdisjoint({r.id for r in page2})
+
+    def test_offset_past_end_returns_empty(self, filled_repo):
+        assert list(filled_repo.find(limit=10, offset=10)) == []
+
+    def test_count_matching_no_filters(self, filled_repo):
+        assert filled_repo.count_matching() == 4
+
+    def test_count_matching_combined_filters(self, filled_repo):
+        assert filled_repo.count_matching(receipt_type="purchase") == 3
+        assert filled_repo.count_matching(
+            receipt_type="purchase", category="software",
+        ) == 2
+        assert filled_repo.count_matching(
+            receipt_type="purchase", category="software",
+            start=date(2024, 1, 1), end=date(2024, 3, 31),
+        ) == 1
+
+    def test_count_matching_ignores_paging(self, filled_repo):
+        # total semantics for GET /receipts: count is filter-wide, not page-wide
+        assert filled_repo.count_matching() == 4
+        assert len(list(filled_repo.find(limit=1))) == 1
+
+
+# ---------------------------------------------------------------------------
+# find_for_ustva / has_any_in_period
+# ---------------------------------------------------------------------------
+
+class TestFindForUstva:
+    def test_includes_receipts_with_vat(self, repo):
+        r = _make_receipt(receipt_date=datetime(2024, 2, 1))
+        repo.save(r)
+        result = list(repo.find_for_ustva(date(2024, 1, 1), date(2024, 3, 31)))
+        assert [x.id for x in result] == [r.id]
+
+    def test_excludes_receipts_without_vat(self, repo):
+        repo.save(_make_receipt(
+            receipt_date=datetime(2024, 2, 1),
+            vat_percentage=None, vat_amount=None,
+        ))
+        result = list(repo.find_for_ustva(date(2024, 1, 1), date(2024, 3, 31)))
+        assert result == []
+
+    def test_includes_einfuhr_purchase_without_regular_vat(self, repo):
+        r = _make_receipt(
+            receipt_date=datetime(2024, 2, 1),
+            vat_percentage=None, vat_amount=None,
+        )
+        r.einfuhr_vat = Decimal("12.50")
+        repo.save(r)
+        result = list(repo.find_for_ustva(date(2024, 1, 1), date(2024, 3, 31)))
+        assert [x.id for x in result] == [r.id]
+
+    def test_excludes_outside_period(self, repo):
+        repo.save(_make_receipt(receipt_date=datetime(2024, 7, 1)))
+        result = list(repo.find_for_ustva(date(2024, 1, 1), date(2024, 3, 31)))
+        assert result == []
+
+
+class TestHasAnyInPeriod:
+    def test_true_when_receipt_in_range(self, repo):
+        repo.save(_make_receipt(receipt_date=datetime(2024, 2, 1)))
+        assert repo.has_any_in_period(date(2024, 1, 1), date(2024, 3, 31)) is True
+
+    def test_false_when_empty_range(self, repo):
+        repo.save(_make_receipt(receipt_date=datetime(2024, 7, 1)))
+        assert repo.has_any_in_period(date(2024, 1, 1), date(2024, 3, 31)) is False
+
+    def test_accepts_datetime_bounds(self, repo):
+        repo.save(_make_receipt(receipt_date=datetime(2024, 2, 1)))
+        assert repo.has_any_in_period(
+            datetime(2024, 1, 1), datetime(2024, 3, 31),
+        ) is True
+
+
 # ---------------------------------------------------------------------------
 # Persistence across re-opens
 # ---------------------------------------------------------------------------
@@ -443,6 +580,89 @@ class TestPersistence:
             all_receipts = list(repo2.list_all())
         assert len(all_receipts) == 1
 
+    def test_opens_legacy_schema_database(self, tmp_path):
+        """
+        Regression: _migrate must cope with a pre-vat_splits database —
+        missing tables (receipt_vat_splits), a NOT NULL content_hash column,
+        old street/street_number counterparty columns and none of the
+        later receipts columns.  An ALTER fired at a missing table made
+        every legacy project DB unopenable.
+        """
+        import sqlite3
+
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE counterparties (
+                id            TEXT PRIMARY KEY,
+                name          TEXT,
+                street        TEXT,
+                street_number TEXT,
+                postcode      TEXT,
+                city          TEXT,
+                country       TEXT,
+                tax_number    TEXT,
+                vat_id        TEXT,
+                created_at    TEXT NOT NULL
+            );
+            CREATE TABLE receipts (
+                id              TEXT PRIMARY KEY,
+                counterparty_id TEXT REFERENCES counterparties(id),
+                receipt_type    TEXT NOT NULL DEFAULT 'purchase',
+                receipt_number  TEXT,
+                receipt_date    TEXT,
+                total_amount    TEXT,
+                vat_percentage  TEXT,
+                vat_amount      TEXT,
+                category        TEXT,
+                created_at      TEXT NOT NULL
+            );
+            CREATE TABLE receipt_items (
+                id          TEXT PRIMARY KEY,
+                receipt_id  TEXT NOT NULL REFERENCES receipts(id) ON DELETE CASCADE,
+                description TEXT,
+                quantity    TEXT,
+                unit_price  TEXT,
+                total_price TEXT,
+                vat_rate    TEXT,
+                category    TEXT
+            );
+            CREATE TABLE receipt_content (
+                receipt_id   TEXT PRIMARY KEY REFERENCES receipts(id) ON DELETE CASCADE,
+                raw_text     TEXT,
+                content_hash TEXT NOT NULL
+            );
+            PRAGMA user_version = 1;
+        """)
+        conn.execute(
+            "INSERT INTO counterparties VALUES ('cp1', 'Alt GmbH', 'Altstraße', '9',"
+            " '10115', 'Berlin', 'Germany', NULL, NULL, '2023-01-01T00:00:00')"
+        )
+        conn.execute(
+            "INSERT INTO receipts VALUES ('aaaa', 'cp1', 'purchase', 'RE-1',"
+            " '2023-06-01', '119.00', '19', '19.00', 'software', '2023-01-01T00:00:00')"
+        )
+        conn.execute(
+            "INSERT INTO receipt_content VALUES ('aaaa', 'legacy raw text', 'deadbeef')"
+        )
+        conn.commit()
+        conn.close()
+
+        with SQLiteRepository(db_path=db_path) as repo:
+            # Pre-existing data survives the migration
+            legacy = repo.get("aaaa")
+            assert legacy is not None
+            assert legacy.total_amount == Decimal("119.00")
+            assert legacy.counterparty.name == "Alt GmbH"
+            # street/street_number merged into street_and_number
+            assert legacy.counterparty.address.street_and_number == "Altstraße 9"
+            # New receipts save and load on the migrated schema
+            r = _make_receipt(items=[_make_item()])
+            repo.save(r)
+            found = repo.get(r.id)
+            assert found is not None
+            assert len(found.items) == 1
+
 
 # ---------------------------------------------------------------------------
 # update (receipt partial update)
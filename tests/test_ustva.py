@@ -352,6 +352,20 @@ class TestRounding:
         report = generate_ustva(receipts, Q1_START, Q1_END)
         assert report.lines["19"].purchase_vat == Decimal("1.60")
 
+    def test_sums_of_quantized_amounts_need_no_rerounding(self):
+        """Each amount is quantized once on ingress; the per-rate sums must
+        already carry exactly two decimal places without a final pass."""
+        receipts = [
+            _receipt(total_amount="10.00", vat_amount="1.905", vat_percentage="19"),
+            _receipt(total_amount="7.77",  vat_amount="1.241", vat_percentage="19"),
+            _receipt(total_amount="3.33",  vat_amount="0.532", vat_percentage="19"),
+        ]
+        report = generate_ustva(receipts, Q1_START, Q1_END)
+        ln = report.lines["19"]
+        for value in (ln.purchase_vat, ln.purchase_net, ln.sale_vat, ln.sale_net):
+            assert value == value.quantize(Decimal("0.01"))
+            assert value.as_tuple().exponent == -2
+
     def test_decimal_normalisation(self):
         """Decimal('19.0').normalize() == '19' — both map to the same bucket."""
         receipts = [
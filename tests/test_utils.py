@@ -150,6 +150,59 @@ class TestExtractAmounts:
         result = DataExtractor.extract_amounts("Summe: 1.234,56 €")
         assert result["total"] == Decimal("1234.56")
 
+    def test_total_only_returns_anchored_total(self):
+        text = (
+            "Druckerpapier  50,00 €\n"
+            "Gesamtbetrag  949,00 €\n"
+            "Kundenkarte   899,00 €"   # after the total line — must not be scanned
+        )
+        result = DataExtractor.extract_amounts(text, total_only=True)
+        assert result["total"] == Decimal("949.00")
+        assert result["all"] == [Decimal("949.00")]
+
+    def test_total_only_falls_back_to_max_without_keyword(self):
+        result = DataExtractor.extract_amounts(
+            "A: 10,00 €\nB: 30,00 €", total_only=True
+        )
+        assert result["total"] == Decimal("30.00")
+
+
+# ---------------------------------------------------------------------------
+# extract_all — façade must agree with the individual extractors
+# ---------------------------------------------------------------------------
+
+class TestExtractAll:
+    TEXT = (
+        "Müller GmbH\n"
+        "Datum: 15.03.2024\n"
+        "Druckerpapier A4  12,99 €\n"
+        "MwSt. 19% enthaltene Steuer 3,41 €\n"
+        "Gesamtbetrag  21,40 €"
+    )
+
+    def test_matches_individual_extractors(self):
+        result = DataExtractor.extract_all(self.TEXT)
+        assert result["company_name"] == DataExtractor.extract_company_name(self.TEXT)
+        assert result["date"] == DataExtractor.extract_date(self.TEXT)
+        assert result["amounts"] == DataExtractor.extract_amounts(self.TEXT)
+        assert result["vat"] == DataExtractor.extract_vat_info(self.TEXT)
+        assert result["items"] == DataExtractor.extract_items(self.TEXT)
+
+    def test_field_values(self):
+        result = DataExtractor.extract_all(self.TEXT)
+        assert result["company_name"] == "Müller GmbH"
+        assert result["date"] == datetime(2024, 3, 15)
+        assert result["amounts"]["total"] == Decimal("21.40")
+        assert result["vat"]["vat_percentage"] == Decimal("19")
+        assert any(i["description"] == "Druckerpapier A4" for i in result["items"])
+
+    def test_empty_text(self):
+        result = DataExtractor.extract_all("")
+        assert result["company_name"] is None
+        assert result["date"] is None
+        assert result["amounts"]["total"] is None
+        assert result["items"] == []
+
 
 # ---------------------------------------------------------------------------
 # extract_vat_info